@@ -1,12 +1,23 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from class_lib.chat_service import ChatService
+from apps.chatbot.deps import logger
 from apps.chatbot.router import router
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # ChatService 1회 생성 (첫 요청 지연 방지)
+    app.state.chat_service = ChatService(logger)
+    yield
+
+
 def create_app() -> FastAPI:
     app = FastAPI(
         title="LLM Chatbot",
         description="로컬 LLM 기반 스포츠 데이터 Q&A 챗봇",
         version="0.0.1",
+        lifespan=lifespan,
     )
 
     app.include_router(router)
@@ -4,6 +4,8 @@ Chatbot Dependencies
 FastAPI 의존성 주입 모듈
 """
 
+from functools import lru_cache
+
 from fastapi import Depends, HTTPException, status, Request
 from class_config.class_log import ConfigLogger
 from class_lib.auth import Auth
@@ -14,15 +16,11 @@ logger = ConfigLogger('http_log', 365).get_logger('chatbot')
 
 # 서비스 인스턴스 (싱글톤)
 auth = Auth(logger)
-_chat_service: ChatService = None
 
 
-def get_chat_service() -> ChatService:
-    """ChatService 싱글톤 반환"""
-    global _chat_service
-    if _chat_service is None:
-        _chat_service = ChatService(logger)
-    return _chat_service
+async def get_chat_service(request: Request) -> ChatService:
+    """ChatService 반환 (lifespan에서 생성된 app.state 인스턴스)"""
+    return request.app.state.chat_service
 
 
 async def get_current_payload(request: Request):
@@ -55,7 +53,12 @@ def get_user_id(payload: dict = Depends(get_current_payload)) -> str:
 
 
 def require_role(*roles):
-    """역할 기반 접근 제어"""
+    """역할 기반 접근 제어 (같은 roles → 같은 checker, FastAPI 의존성 캐시 공유)"""
+    return _require_role(roles)
+
+
+@lru_cache(maxsize=None)
+def _require_role(roles: tuple):
     async def _wrapper(payload: dict = Depends(get_current_payload)):
         user_role = payload.get("role") if isinstance(payload, dict) else None
 
@@ -63,6 +63,9 @@ class SkillLoader:
             self.skills_dir = base_dir / "skills"
 
         self._cache: dict[str, str] = {}
+        # 스킬 목록 인덱스 (디렉토리 mtime 기준 유효성 검사)
+        self._index: Optional[list[str]] = None
+        self._index_mtime: Optional[int] = None
         self.logger.info(f"SkillLoader 초기화: {self.skills_dir}")
 
     def load(self, skill_name: str, use_cache: bool = True) -> Optional[str]:
@@ -126,20 +129,28 @@ class SkillLoader:
             self.logger.info(f"[Skill] Cache cleared: {skill_name}")
         else:
             self._cache.clear()
+            self._index = None
+            self._index_mtime = None
             self.logger.info("[Skill] All cache cleared")
 
     def list_skills(self) -> list[str]:
-        """사용 가능한 스킬 목록"""
-        if not self.skills_dir.exists():
+        """사용 가능한 스킬 목록 (디렉토리 변경 시에만 재스캔)"""
+        try:
+            mtime = self.skills_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._index = None
+            self._index_mtime = None
             return []
 
-        skills = []
-        for f in self.skills_dir.glob("*.md"):
-            if not f.name.startswith("_"):
-                skills.append(f.stem)
+        if self._index is None or self._index_mtime != mtime:
+            self._index = [
+                f.stem for f in self.skills_dir.glob("*.md")
+                if not f.name.startswith("_")
+            ]
+            self._index_mtime = mtime
+            self.logger.debug(f"[Skill] Available: {self._index}")
 
-        self.logger.debug(f"[Skill] Available: {skills}")
-        return skills
+        return list(self._index)
 
 
 class ChatService:
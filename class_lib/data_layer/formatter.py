@@ -12,7 +12,7 @@ from dataclasses import dataclass, field
 from class_config.class_env import Config
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FormattedContext:
     """포맷된 컨텍스트 데이터"""
     text: str
@@ -14,10 +14,12 @@ CHART_BLOCK_PATTERN = re.compile(
     re.DOTALL
 )
 
-ALLOWED_CHART_TYPES = {"bar", "line", "pie"}
+EXCESS_NEWLINES_PATTERN = re.compile(r'\n{3,}')
 
+ALLOWED_CHART_TYPES = frozenset({"bar", "line", "pie"})
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ParsedResponse:
     """파싱된 응답"""
     text: str
@@ -132,7 +134,7 @@ class ResponseFormatter:
         if chart_type not in ALLOWED_CHART_TYPES:
             self.logger.warning(
                 f"[Formatter] Invalid chart type: {chart_type}, "
-                f"allowed: {ALLOWED_CHART_TYPES}"
+                f"allowed: {sorted(ALLOWED_CHART_TYPES)}"
             )
             return False
 
@@ -182,10 +184,7 @@ class ResponseFormatter:
             self.logger.warning("[Formatter] Dataset missing data")
             return False
 
-        if not all(isinstance(v, (int, float)) for v in data):
-            self.logger.warning("[Formatter] Dataset data must be list[number]")
-            return False
-
+        # 길이 비교(O(1))를 원소 타입 검사(O(n))보다 먼저 수행
         if len(data) != len(labels):
             self.logger.warning(
                 f"[Formatter] Length mismatch: labels={len(labels)}, "
@@ -193,6 +192,10 @@ class ResponseFormatter:
             )
             return False
 
+        if not all(isinstance(v, (int, float)) for v in data):
+            self.logger.warning("[Formatter] Dataset data must be list[number]")
+            return False
+
         return True
 
     def _remove_blocks(self, content: str, matches: list) -> str:
@@ -200,11 +203,14 @@ class ResponseFormatter:
         if not matches:
             return content.strip()
 
-        result = content
-        for match in reversed(matches):
-            start, end = match.start(), match.end()
-            result = result[:start] + result[end:]
+        # 블록 사이 구간만 모아 1회 결합 (블록마다 문자열 재생성 방지)
+        parts = []
+        pos = 0
+        for match in matches:
+            parts.append(content[pos:match.start()])
+            pos = match.end()
+        parts.append(content[pos:])
 
-        result = re.sub(r'\n{3,}', '\n\n', result)
+        result = EXCESS_NEWLINES_PATTERN.sub('\n\n', ''.join(parts))
 
         return result.strip()
@@ -15,7 +15,7 @@ from redis.sentinel import Sentinel
 from class_config.class_env import Config
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatMessage:
     """채팅 메시지"""
     role: str  # "user", "assistant", "system"
@@ -30,7 +30,7 @@ class ChatMessage:
         return {"role": self.role, "content": self.content}
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatSession:
     """채팅 세션 데이터"""
     session_id: str
@@ -373,7 +373,8 @@ User=ubuntu
 WorkingDirectory=/home/ubuntu/work/llm-chatbot/embed/samples
 ExecStart=/home/ubuntu/work/llm-chatbot/venv/bin/uvicorn \\
     gateway:app \\
-    --host 0.0.0.0 --port ${GATEWAY_PORT}
+    --host 0.0.0.0 --port ${GATEWAY_PORT} \\
+    --loop uvloop --http httptools
 Restart=always
 RestartSec=3
 Environment="PYTHONUNBUFFERED=1"
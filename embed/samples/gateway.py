@@ -6,9 +6,14 @@ spo-chatbot 프레임워크 검증 샘플 게이트웨이
 실행:
     cd embed/samples
     uvicorn gateway:app --port 5174 --reload
+
+운영 (deploy.sh setup):
+    uvicorn gateway:app --port 5174 --loop uvloop --http httptools
 """
 
 import os
+import re
+import stat
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -39,6 +44,10 @@ EMBED_DIST_DIR = EMBED_DIR / "dist"
 EMBED_JS_PATH = EMBED_DIST_DIR / "embed.js"
 DEV_PAGE_PATH = EMBED_DIR / "index.html"
 
+# FileResponse용 경로 문자열 (요청마다 Path 변환 방지)
+EMBED_JS_FILE = str(EMBED_JS_PATH)
+IFRAME_HOST_HTML = str(BASE_DIR / "iframe" / "host.html")
+
 # htmx 템플릿 디렉토리
 HTMX_TEMPLATES_DIR = BASE_DIR / "htmx" / "templates"
 
@@ -52,9 +61,77 @@ GATEWAY_TEMPLATES_DIR = BASE_DIR / "templates"
 DEV_TEST_TOKEN = "dev-test-token"
 API_URL_PLACEHOLDER = "__CHATBOT_API_URL__"
 
+_DEV_TEST_TOKEN_BYTES = DEV_TEST_TOKEN.encode()
+_API_URL_PLACEHOLDER_BYTES = API_URL_PLACEHOLDER.encode()
+
+# 두 플레이스홀더를 한 번의 스캔으로 치환
+_PLACEHOLDER_PATTERN = re.compile(
+    re.escape(_API_URL_PLACEHOLDER_BYTES) + b"|" + re.escape(_DEV_TEST_TOKEN_BYTES)
+)
+
 # 치환 대상 Content-Type
 _REPLACEABLE_TYPES = ("text/html", "application/javascript", "text/javascript")
 
+# 치환 검사 대상 확장자 (그 외 정적 파일은 플레이스홀더가 없으므로 항상 통과)
+_REPLACEABLE_SUFFIXES = (".html", ".js", ".mjs")
+
+# 빌드 산출물 마운트 (샘플명 → 디렉토리, /sample/<샘플명>/ 으로 서빙)
+_BUILT_SAMPLE_DIRS = {
+    "vue3": BASE_DIR / "vue3" / "dist",
+    "react": BASE_DIR / "react" / "dist",
+    "svelte": BASE_DIR / "svelte" / "dist",
+    "nextjs": BASE_DIR / "nextjs" / "out",
+    "angular": BASE_DIR / "angular" / "dist" / "browser",
+}
+
+# 빌드 산출물 플레이스홀더 포함 여부 캐시: 파일 경로 → (st_mtime_ns, st_size, 포함 여부)
+# 같은 이름으로 재빌드되면 mtime/size가 바뀌므로 다시 검사한다.
+_placeholder_cache: dict[str, tuple[int, int, bool]] = {}
+
+
+def _built_file(url_path: str) -> str | None:
+    """URL 경로 → 빌드 산출물 파일 경로 (빌드 디렉토리 밖이면 None)"""
+    for name, directory in _BUILT_SAMPLE_DIRS.items():
+        prefix = f"/sample/{name}/"
+        if not url_path.startswith(prefix):
+            continue
+        relative = url_path[len(prefix):]
+        file_path = os.path.normpath(os.path.join(directory, relative))
+        if relative and file_path.startswith(f"{directory}{os.sep}"):
+            return file_path
+        return None
+    return None
+
+
+def _is_passthrough(url_path: str) -> bool:
+    """플레이스홀더가 없는 빌드 산출물이면 True (치환 없이 스트리밍 통과)
+
+    디렉토리 경로(/sample/vue3/ → index.html)나 확장자 없는 경로처럼
+    실제 파일과 1:1 대응하지 않는 요청은 기존대로 치환 검사를 거친다.
+    """
+    file_path = _built_file(url_path)
+    if file_path is None:
+        return False
+
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return False
+    if not stat.S_ISREG(st.st_mode):
+        return False
+
+    if not file_path.endswith(_REPLACEABLE_SUFFIXES):
+        return True
+
+    cached = _placeholder_cache.get(file_path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return not cached[2]
+
+    with open(file_path, "rb") as f:
+        has_placeholder = _PLACEHOLDER_PATTERN.search(f.read()) is not None
+    _placeholder_cache[file_path] = (st.st_mtime_ns, st.st_size, has_placeholder)
+    return not has_placeholder
+
 
 class TokenInjectionMiddleware(BaseHTTPMiddleware):
     """응답 내 플레이스홀더를 실제 값으로 서버 사이드 치환한다.
@@ -64,32 +141,41 @@ class TokenInjectionMiddleware(BaseHTTPMiddleware):
     - dev-test-token → 요청에서 전달된 실제 토큰
     """
 
+    def __init__(self, app, dispatch=None):
+        super().__init__(app, dispatch)
+        # 환경변수에만 의존하므로 기동 시 1회 결정
+        self._api_replace_needed = CHATBOT_API_URL != API_URL_PLACEHOLDER
+        self._api_value_bytes = CHATBOT_API_URL.encode()
+
     async def dispatch(self, request, call_next):
+        # GET 이외 요청, 플레이스홀더가 없는 정적 파일은 그대로 통과
+        if request.method != "GET" or _is_passthrough(request.url.path):
+            return await call_next(request)
+
         token = request.query_params.get("token") or request.cookies.get("access_token")
 
         response = await call_next(request)
-        content_type = response.headers.get("content-type", "")
+        if response.status_code != 200:
+            return response
 
         # HTML 또는 JS 응답만 치환
+        content_type = response.headers.get("content-type", "")
         if not any(ct in content_type for ct in _REPLACEABLE_TYPES):
             return response
 
         # api-url 치환이 필요하거나, 토큰 치환이 필요한 경우
-        needs_api_replace = CHATBOT_API_URL != API_URL_PLACEHOLDER
         needs_token_replace = token and token != DEV_TEST_TOKEN
 
-        if not needs_api_replace and not needs_token_replace:
+        if not self._api_replace_needed and not needs_token_replace:
             return response
 
-        body = b""
-        async for chunk in response.body_iterator:
-            body += chunk
-        text = body.decode("utf-8")
+        body = b"".join([chunk async for chunk in response.body_iterator])
 
-        if needs_api_replace:
-            text = text.replace(API_URL_PLACEHOLDER, CHATBOT_API_URL)
-        if needs_token_replace:
-            text = text.replace(DEV_TEST_TOKEN, token)
+        replacements = {
+            _API_URL_PLACEHOLDER_BYTES: self._api_value_bytes,
+            _DEV_TEST_TOKEN_BYTES: token.encode() if needs_token_replace else _DEV_TEST_TOKEN_BYTES,
+        }
+        body = _PLACEHOLDER_PATTERN.sub(lambda m: replacements[m.group(0)], body)
 
         headers = {
             k: v for k, v in response.headers.items()
@@ -99,7 +185,7 @@ class TokenInjectionMiddleware(BaseHTTPMiddleware):
         # 원래 Content-Type 유지
         media_type = "text/html" if "text/html" in content_type else "application/javascript"
         return Response(
-            content=text,
+            content=body,
             status_code=response.status_code,
             headers=headers,
             media_type=media_type,
@@ -126,7 +212,7 @@ htmx_templates = Jinja2Templates(directory=str(HTMX_TEMPLATES_DIR))
 async def serve_embed_js():
     """Vite 기반 샘플(vue3, react, svelte)용 — /embed.js"""
     return FileResponse(
-        str(EMBED_JS_PATH),
+        EMBED_JS_FILE,
         media_type="application/javascript",
     )
 
@@ -135,7 +221,7 @@ async def serve_embed_js():
 async def serve_embed_js_dist():
     """vanilla, iframe 호환용 — /dist/embed.js"""
     return FileResponse(
-        str(EMBED_JS_PATH),
+        EMBED_JS_FILE,
         media_type="application/javascript",
     )
 
@@ -200,7 +286,7 @@ async def htmx_index(request: Request):
 async def iframe_index():
     """iframe 샘플 — host.html 서빙 (index.html 없음)"""
     return FileResponse(
-        str(BASE_DIR / "iframe" / "host.html"),
+        IFRAME_HOST_HTML,
         media_type="text/html",
     )
 
@@ -212,41 +298,13 @@ async def iframe_index():
 # html=True 옵션으로 index.html 자동 서빙
 # ============================================================
 
-# Vite 빌드 결과물
-app.mount(
-    "/sample/vue3",
-    StaticFiles(directory=str(BASE_DIR / "vue3" / "dist"), html=True),
-    name="vue3",
-)
-
-app.mount(
-    "/sample/react",
-    StaticFiles(directory=str(BASE_DIR / "react" / "dist"), html=True),
-    name="react",
-)
-
-app.mount(
-    "/sample/svelte",
-    StaticFiles(directory=str(BASE_DIR / "svelte" / "dist"), html=True),
-    name="svelte",
-)
-
-# Next.js 정적 내보내기
-app.mount(
-    "/sample/nextjs",
-    StaticFiles(directory=str(BASE_DIR / "nextjs" / "out"), html=True),
-    name="nextjs",
-)
-
-# Angular 빌드 결과물
-app.mount(
-    "/sample/angular",
-    StaticFiles(
-        directory=str(BASE_DIR / "angular" / "dist" / "browser"),
-        html=True,
-    ),
-    name="angular",
-)
+# 빌드 결과물 (Vite / Next.js 정적 내보내기 / Angular)
+for _name, _directory in _BUILT_SAMPLE_DIRS.items():
+    app.mount(
+        f"/sample/{_name}",
+        StaticFiles(directory=str(_directory), html=True),
+        name=_name,
+    )
 
 # 정적 HTML 샘플
 app.mount(
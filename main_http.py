@@ -10,11 +10,24 @@ from apps.auth.router import router as auth_router
 
 logger = logging.getLogger(__name__)
 
+# Swagger bearerAuth 적용 제외 경로 (prefix)
+AUTH_EXCLUDED_PREFIXES = (
+    "/api/chat/hello",
+    "/api/chat/health",
+    "/api/chat/providers",
+    "/api/auth/login",
+    "/api/auth/logout",
+)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("LLM Chatbot 서비스 시작")
-    yield
+    # OpenAPI 스키마 선계산 (첫 /docs 요청 지연 방지)
+    app.openapi()
+    # 마운트된 서브앱 lifespan은 자동 실행되지 않으므로 직접 진입
+    async with chatbot_app.router.lifespan_context(chatbot_app):
+        yield
     logger.info("LLM Chatbot 서비스 종료")
 
 
@@ -75,17 +88,9 @@ def custom_openapi():
     }
 
     # 인증이 필요한 엔드포인트에 보안 적용
-    auth_excluded_paths = [
-        "/api/chat/hello",
-        "/api/chat/health",
-        "/api/chat/providers",
-        "/api/auth/login",
-        "/api/auth/logout",
-    ]
-
     for path, path_item in root_schema.get("paths", {}).items():
         # 제외 경로 체크
-        if any(path.startswith(excluded) for excluded in auth_excluded_paths):
+        if path.startswith(AUTH_EXCLUDED_PREFIXES):
             continue
 
         for method in path_item.values():
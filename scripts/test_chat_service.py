@@ -13,23 +13,50 @@ ChatService 테스트 스크립트
     python scripts/test_chat_service.py --test stream
     python scripts/test_chat_service.py --test session
     python scripts/test_chat_service.py --test skill
+
+    # 요약/오류만 출력
+    python scripts/test_chat_service.py --quiet
 """
 
 import sys
 import asyncio
 import argparse
+import uuid
+from functools import lru_cache
 from pathlib import Path
 
-# 프로젝트 루트를 path에 추가
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+try:
+    import uvloop
+except ImportError:  # uvloop 미설치 환경 (Windows 등) → 기본 이벤트 루프
+    uvloop = None
+
+# 프로젝트 루트를 path에 추가 (이미 있으면 생략)
+project_root = Path(__file__).resolve().parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from class_config.class_log import ConfigLogger
 from class_lib.chat_service import ChatService
 
+# 실행별 user_id 접미사 (병렬 실행 시 Redis 세션 키 충돌 방지)
+RUN_ID = uuid.uuid4().hex[:8]
+
+
+_HR = "=" * 60
+
+# --quiet 지정 시 상세 출력 생략 (요약/오류만 출력)
+QUIET = False
 
+
+def log(*args, **kwargs):
+    """상세 출력 (--quiet 시 생략)"""
+    if not QUIET:
+        print(*args, **kwargs)
+
+
+@lru_cache(maxsize=1)
 def create_service():
-    """ChatService 인스턴스 생성"""
+    """ChatService 인스턴스 생성 (프로세스 내 1회, 이후 재사용)"""
     logger = ConfigLogger('chat_test', 7).get_logger('test')
     # skills 디렉토리 명시적 지정
     skills_dir = project_root / "skills"
@@ -38,39 +65,41 @@ def create_service():
 
 async def test_health_check():
     """Health Check 테스트"""
-    print("\n" + "=" * 60)
-    print("TEST: Health Check")
-    print("=" * 60)
+    log("\n" + _HR)
+    log("TEST: Health Check")
+    log(_HR)
 
     service = create_service()
     status = await service.health_check()
 
-    print(f"\nOllama: {status['ollama']}")
-    print(f"Redis: {status['redis']}")
-    print(f"Skills: {status['skills']}")
-    print(f"Healthy: {status['healthy']}")
+    # 실패 시 원인은 --quiet 여부와 관계없이 출력
+    out = log if status['healthy'] else print
+    out(f"\nOllama: {status['ollama']}")
+    out(f"Redis: {status['redis']}")
+    out(f"Skills: {status['skills']}")
+    out(f"Healthy: {status['healthy']}")
 
     return status['healthy']
 
 
 async def test_skill_loader():
     """SKILL 로더 테스트"""
-    print("\n" + "=" * 60)
-    print("TEST: Skill Loader")
-    print("=" * 60)
+    log("\n" + _HR)
+    log("TEST: Skill Loader")
+    log(_HR)
 
     service = create_service()
 
     # 스킬 목록
     skills = service.skill_loader.list_skills()
-    print(f"\nAvailable skills: {skills}")
+    log(f"\nAvailable skills: {skills}")
 
     # badminton 스킬 로드
     badminton_skill = service.skill_loader.load("badminton")
     if badminton_skill:
-        print(f"\nbadminton.md loaded: {len(badminton_skill)} chars")
-        print("--- Preview (first 300 chars) ---")
-        print(badminton_skill[:300] + "...")
+        log(f"\nbadminton.md loaded: {len(badminton_skill)} chars")
+        log("--- Preview (first 300 chars) ---")
+        log(badminton_skill[:300] + "...")
     else:
         print("\nbadminton.md NOT FOUND")
         return False
@@ -85,26 +114,26 @@ async def test_skill_loader():
 
 async def test_session():
     """세션 테스트"""
-    print("\n" + "=" * 60)
-    print("TEST: Session Management")
-    print("=" * 60)
+    log("\n" + _HR)
+    log("TEST: Session Management")
+    log(_HR)
 
     service = create_service()
 
-    user_id = "test_user_001"
+    user_id = f"test_user_001_{RUN_ID}"
     context_type = "badminton"
 
     # 기존 세션 삭제
     service.delete_session(user_id, context_type)
 
     # 세션 생성
-    print(f"\nCreating session for {user_id}...")
+    log(f"\nCreating session for {user_id}...")
     session = service.session.get_or_create_session(
         user_id=user_id,
         context_type=context_type,
         context={"match_id": "match_123"}
     )
-    print(f"Session created: {session.session_id}")
+    log(f"Session created: {session.session_id}")
 
     # 메시지 추가
     session.add_message("user", "테스트 메시지 1")
@@ -114,42 +143,42 @@ async def test_session():
 
     # 세션 조회
     loaded_session = service.session.get_session(user_id, context_type)
-    print(f"Loaded session: {loaded_session.session_id}")
-    print(f"Messages: {len(loaded_session.messages)}")
-    print(f"Context: {loaded_session.context}")
+    log(f"Loaded session: {loaded_session.session_id}")
+    log(f"Messages: {len(loaded_session.messages)}")
+    log(f"Context: {loaded_session.context}")
 
     # 세션 정보
     info = service.get_session_info(user_id, context_type)
-    print(f"\nSession info: {info}")
+    log(f"\nSession info: {info}")
 
     # 히스토리 삭제
     service.clear_history(user_id, context_type)
     loaded_session = service.session.get_session(user_id, context_type)
-    print(f"After clear: {len(loaded_session.messages)} messages")
+    log(f"After clear: {len(loaded_session.messages)} messages")
 
     # 세션 삭제
     service.delete_session(user_id, context_type)
-    print("Session deleted")
+    log("Session deleted")
 
     return True
 
 
 async def test_chat():
     """채팅 테스트 (비스트리밍)"""
-    print("\n" + "=" * 60)
-    print("TEST: Chat (non-streaming)")
-    print("=" * 60)
+    log("\n" + _HR)
+    log("TEST: Chat (non-streaming)")
+    log(_HR)
 
     service = create_service()
 
-    user_id = "test_user_chat"
+    user_id = f"test_user_chat_{RUN_ID}"
     context_type = "badminton"
 
     # 기존 세션 삭제
     service.delete_session(user_id, context_type)
 
     # 첫 번째 메시지
-    print("\n--- First message ---")
+    log("\n--- First message ---")
     result1 = await service.chat(
         user_id=user_id,
         message="안녕하세요! 배드민턴에 대해 질문할게요.",
@@ -158,16 +187,16 @@ async def test_chat():
         max_tokens=256
     )
 
-    print(f"\nResponse: {result1.content}")
-    print(f"\nMetadata:")
-    print(f"  Session: {result1.session_id}")
-    print(f"  Model: {result1.model}")
-    print(f"  Response Time: {result1.response_time_ms:.1f}ms")
-    print(f"  Tokens: {result1.tokens}")
-    print(f"  Message Count: {result1.message_count}")
+    log(f"\nResponse: {result1.content}")
+    log(f"\nMetadata:")
+    log(f"  Session: {result1.session_id}")
+    log(f"  Model: {result1.model}")
+    log(f"  Response Time: {result1.response_time_ms:.1f}ms")
+    log(f"  Tokens: {result1.tokens}")
+    log(f"  Message Count: {result1.message_count}")
 
     # 두 번째 메시지 (대화 이어가기)
-    print("\n--- Second message (follow-up) ---")
+    log("\n--- Second message (follow-up) ---")
     result2 = await service.chat(
         user_id=user_id,
         message="안세영 선수에 대해 간단히 설명해주세요. (3문장 이내)",
@@ -176,12 +205,12 @@ async def test_chat():
         max_tokens=512
     )
 
-    print(f"\nResponse: {result2.content}")
-    print(f"Message Count: {result2.message_count}")
+    log(f"\nResponse: {result2.content}")
+    log(f"Message Count: {result2.message_count}")
 
     # 세션 정보 확인
     info = service.get_session_info(user_id, context_type)
-    print(f"\nFinal session info: {info}")
+    log(f"\nFinal session info: {info}")
 
     # 정리
     service.delete_session(user_id, context_type)
@@ -191,20 +220,22 @@ async def test_chat():
 
 async def test_chat_stream():
     """스트리밍 채팅 테스트"""
-    print("\n" + "=" * 60)
-    print("TEST: Chat (streaming)")
-    print("=" * 60)
+    log("\n" + _HR)
+    log("TEST: Chat (streaming)")
+    log(_HR)
 
     service = create_service()
 
-    user_id = "test_user_stream"
+    user_id = f"test_user_stream_{RUN_ID}"
     context_type = "badminton"
 
     # 기존 세션 삭제
     service.delete_session(user_id, context_type)
 
-    print("\n--- Streaming Response ---")
-    full_response = ""
+    log("\n--- Streaming Response ---")
+    chunks: list[str] = []
+    buf: list[str] = []
+    buf_len = 0
 
     async for chunk in service.chat_stream(
         user_id=user_id,
@@ -213,15 +244,25 @@ async def test_chat_stream():
         temperature=0.5,
         max_tokens=512
     ):
-        print(chunk, end="", flush=True)
-        full_response += chunk
-
-    print(f"\n\n--- Stats ---")
-    print(f"Total length: {len(full_response)} chars")
+        chunks.append(chunk)
+        buf.append(chunk)
+        buf_len += len(chunk)
+        # 512자 이상 쌓이거나 줄바꿈이 오면 한 번에 출력
+        if buf_len >= 512 or "\n" in chunk:
+            log("".join(buf), end="", flush=True)
+            buf.clear()
+            buf_len = 0
+
+    if buf:
+        log("".join(buf), end="", flush=True)
+    full_response = "".join(chunks)
+
+    log(f"\n\n--- Stats ---")
+    log(f"Total length: {len(full_response)} chars")
 
     # 세션 확인
     info = service.get_session_info(user_id, context_type)
-    print(f"Session messages: {info['message_count']}")
+    log(f"Session messages: {info['message_count']}")
 
     # 정리
     service.delete_session(user_id, context_type)
@@ -231,17 +272,19 @@ async def test_chat_stream():
 
 async def test_multi_turn():
     """멀티턴 대화 테스트"""
-    print("\n" + "=" * 60)
-    print("TEST: Multi-turn Conversation")
-    print("=" * 60)
+    log("\n" + _HR)
+    log("TEST: Multi-turn Conversation")
+    log(_HR)
 
     service = create_service()
 
-    user_id = "test_user_multi"
+    user_id = f"test_user_multi_{RUN_ID}"
     context_type = "badminton"
 
-    # 기존 세션 삭제
-    service.delete_session(user_id, context_type)
+    # 기존 세션 삭제 + SKILL 캐시 워밍 (첫 턴 전에 병렬 수행)
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(asyncio.to_thread(service.delete_session, user_id, context_type))
+        tg.create_task(asyncio.to_thread(service.skill_loader.load, context_type))
 
     conversations = [
         "안녕하세요",
@@ -250,8 +293,8 @@ async def test_multi_turn():
     ]
 
     for i, message in enumerate(conversations, 1):
-        print(f"\n--- Turn {i} ---")
-        print(f"User: {message}")
+        log(f"\n--- Turn {i} ---")
+        log(f"User: {message}")
 
         result = await service.chat(
             user_id=user_id,
@@ -261,8 +304,8 @@ async def test_multi_turn():
             max_tokens=256
         )
 
-        print(f"Assistant: {result.content}")
-        print(f"(messages in session: {result.message_count})")
+        log(f"Assistant: {result.content}")
+        log(f"(messages in session: {result.message_count})")
 
     # 정리
     service.delete_session(user_id, context_type)
@@ -280,61 +323,85 @@ async def run_all_tests():
         print("\n[STOP] Health check failed.")
         return results
 
-    # 2. Skill Loader
-    results['skill'] = await test_skill_loader()
-
-    # 3. Session
-    results['session'] = await test_session()
-
-    # 4. Chat
-    results['chat'] = await test_chat()
-
-    # 5. Stream
-    results['stream'] = await test_chat_stream()
-
-    # 6. Multi-turn
-    results['multi_turn'] = await test_multi_turn()
-
-    # Summary
-    print("\n" + "=" * 60)
-    print("TEST SUMMARY")
-    print("=" * 60)
-    for test_name, passed in results.items():
-        status = "PASS" if passed else "FAIL"
-        print(f"  {test_name}: {status}")
-
+    # 2~6. 나머지 테스트는 서로 독립적 (user_id 분리)
+    tests = {
+        'skill': test_skill_loader,
+        'session': test_session,
+        'chat': test_chat,
+        'stream': test_chat_stream,
+        'multi_turn': test_multi_turn,
+    }
+    if QUIET:
+        # 상세 출력이 없으므로 동시 실행
+        gathered = await asyncio.gather(
+            *(test() for test in tests.values()),
+            return_exceptions=True
+        )
+    else:
+        # 테스트별 출력이 섞이지 않도록 순차 실행
+        gathered = []
+        for test in tests.values():
+            try:
+                gathered.append(await test())
+            except Exception as e:
+                gathered.append(e)
+    for test_name, outcome in zip(tests, gathered):
+        if isinstance(outcome, BaseException):
+            print(f"\n[ERROR] {test_name}: {outcome}")
+            results[test_name] = False
+        else:
+            results[test_name] = outcome
+
+    # Summary (한 번에 출력)
     passed_count = sum(1 for v in results.values() if v)
     total_count = len(results)
-    print(f"\nTotal: {passed_count}/{total_count} passed")
+    lines = ["", _HR, "TEST SUMMARY", _HR]
+    lines.extend(
+        f"  {test_name}: {'PASS' if passed else 'FAIL'}"
+        for test_name, passed in results.items()
+    )
+    lines.append(f"\nTotal: {passed_count}/{total_count} passed")
+    sys.stdout.write("\n".join(lines) + "\n")
 
     return results
 
 
+_BANNER = f"{_HR}\nChatService Test Script\n{_HR}"
+
+_TEST_MAP = {
+    'health': test_health_check,
+    'skill': test_skill_loader,
+    'session': test_session,
+    'chat': test_chat,
+    'stream': test_chat_stream,
+    'multi': test_multi_turn,
+    'all': run_all_tests
+}
+
+
 def main():
     parser = argparse.ArgumentParser(description='ChatService 테스트')
     parser.add_argument(
         '--test',
-        choices=['health', 'skill', 'session', 'chat', 'stream', 'multi', 'all'],
+        choices=list(_TEST_MAP),
         default='all',
         help='실행할 테스트 (기본: all)'
     )
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='상세 출력 생략 (요약/오류만 출력)'
+    )
     args = parser.parse_args()
 
-    test_map = {
-        'health': test_health_check,
-        'skill': test_skill_loader,
-        'session': test_session,
-        'chat': test_chat,
-        'stream': test_chat_stream,
-        'multi': test_multi_turn,
-        'all': run_all_tests
-    }
+    global QUIET
+    QUIET = args.quiet
 
-    print("=" * 60)
-    print("ChatService Test Script")
-    print("=" * 60)
+    print(_BANNER)
 
-    asyncio.run(test_map[args.test]())
+    loop_factory = uvloop.new_event_loop if uvloop else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(_TEST_MAP[args.test]())
 
 
 if __name__ == "__main__":
@@ -13,16 +13,26 @@ OllamaClient 테스트 스크립트
     python scripts/test_ollama_client.py --test chat
     python scripts/test_ollama_client.py --test stream
     python scripts/test_ollama_client.py --test all
+
+    # 요약/오류만 출력
+    python scripts/test_ollama_client.py --quiet
 """
 
 import sys
 import asyncio
 import argparse
+from functools import lru_cache
 from pathlib import Path
 
-# 프로젝트 루트를 path에 추가
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+try:
+    import uvloop
+except ImportError:  # uvloop 미설치 환경 (Windows 등) → 기본 이벤트 루프
+    uvloop = None
+
+# 프로젝트 루트를 path에 추가 (이미 있으면 생략)
+project_root = Path(__file__).resolve().parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from class_config.class_log import ConfigLogger
 from class_lib.ollama_client import (
@@ -33,39 +43,52 @@ from class_lib.ollama_client import (
 )
 
 
+_HR = "=" * 60
+
+# --quiet 지정 시 상세 출력 생략 (요약/오류만 출력)
+QUIET = False
+
+
+def log(*args, **kwargs):
+    """상세 출력 (--quiet 시 생략)"""
+    if not QUIET:
+        print(*args, **kwargs)
+
+
+@lru_cache(maxsize=1)
 def create_client():
-    """OllamaClient 인스턴스 생성"""
+    """OllamaClient 인스턴스 생성 (프로세스 내 1회, 이후 재사용)"""
     logger = ConfigLogger('ollama_test', 7).get_logger('test')
     return OllamaClient(logger)
 
 
 async def test_health_check():
     """Health Check 테스트"""
-    print("\n" + "=" * 60)
-    print("TEST: Health Check")
-    print("=" * 60)
+    log("\n" + _HR)
+    log("TEST: Health Check")
+    log(_HR)
 
     client = create_client()
     result = await client.health_check()
 
-    print(f"\nResult: {'PASS' if result else 'FAIL'}")
+    log(f"\nResult: {'PASS' if result else 'FAIL'}")
     return result
 
 
 async def test_list_models():
     """모델 목록 조회 테스트"""
-    print("\n" + "=" * 60)
-    print("TEST: List Models")
-    print("=" * 60)
+    log("\n" + _HR)
+    log("TEST: List Models")
+    log(_HR)
 
     client = create_client()
 
     try:
         models = await client.list_models()
-        print(f"\nFound {len(models)} models:")
+        log(f"\nFound {len(models)} models:")
         for m in models:
             size_gb = m.size / 1e9 if m.size else 0
-            print(f"  - {m.name} ({size_gb:.2f}GB)")
+            log(f"  - {m.name} ({size_gb:.2f}GB)")
         return True
     except OllamaConnectionError as e:
         print(f"\nConnection Error: {e}")
@@ -77,9 +100,9 @@ async def test_list_models():
 
 async def test_chat():
     """채팅 테스트 (비스트리밍)"""
-    print("\n" + "=" * 60)
-    print("TEST: Chat (non-streaming)")
-    print("=" * 60)
+    log("\n" + _HR)
+    log("TEST: Chat (non-streaming)")
+    log(_HR)
 
     client = create_client()
 
@@ -94,12 +117,12 @@ async def test_chat():
             max_tokens=256
         )
 
-        print(f"\n--- Response ---")
-        print(response.content)
-        print(f"\n--- Metadata ---")
-        print(f"  Model: {response.model}")
-        print(f"  Response Time: {response.response_time_ms:.1f}ms")
-        print(f"  Tokens: prompt={response.prompt_tokens}, completion={response.completion_tokens}, total={response.total_tokens}")
+        log(f"\n--- Response ---")
+        log(response.content)
+        log(f"\n--- Metadata ---")
+        log(f"  Model: {response.model}")
+        log(f"  Response Time: {response.response_time_ms:.1f}ms")
+        log(f"  Tokens: prompt={response.prompt_tokens}, completion={response.completion_tokens}, total={response.total_tokens}")
         return True
 
     except OllamaModelNotFoundError as e:
@@ -118,9 +141,9 @@ async def test_chat():
 
 async def test_chat_with_system_prompt():
     """시스템 프롬프트 적용 채팅 테스트"""
-    print("\n" + "=" * 60)
-    print("TEST: Chat with System Prompt")
-    print("=" * 60)
+    log("\n" + _HR)
+    log("TEST: Chat with System Prompt")
+    log(_HR)
 
     client = create_client()
 
@@ -140,13 +163,13 @@ async def test_chat_with_system_prompt():
             max_tokens=512
         )
 
-        print(f"\n--- System Prompt ---")
-        print(system_prompt[:100] + "...")
-        print(f"\n--- Response ---")
-        print(response.content)
-        print(f"\n--- Metadata ---")
-        print(f"  Response Time: {response.response_time_ms:.1f}ms")
-        print(f"  Tokens: {response.total_tokens}")
+        log(f"\n--- System Prompt ---")
+        log(system_prompt[:100] + "...")
+        log(f"\n--- Response ---")
+        log(response.content)
+        log(f"\n--- Metadata ---")
+        log(f"  Response Time: {response.response_time_ms:.1f}ms")
+        log(f"  Tokens: {response.total_tokens}")
         return True
 
     except Exception as e:
@@ -156,9 +179,9 @@ async def test_chat_with_system_prompt():
 
 async def test_chat_stream():
     """스트리밍 채팅 테스트"""
-    print("\n" + "=" * 60)
-    print("TEST: Chat (streaming)")
-    print("=" * 60)
+    log("\n" + _HR)
+    log("TEST: Chat (streaming)")
+    log(_HR)
 
     client = create_client()
 
@@ -167,22 +190,32 @@ async def test_chat_stream():
     ]
 
     try:
-        print(f"\n--- Streaming Response ---")
-        full_response = ""
-        chunk_count = 0
+        log(f"\n--- Streaming Response ---")
+        chunks: list[str] = []
+        buf: list[str] = []
+        buf_len = 0
 
         async for chunk in client.chat_stream(
             messages=messages,
             temperature=0.3,
             max_tokens=256
         ):
-            print(chunk, end="", flush=True)
-            full_response += chunk
-            chunk_count += 1
-
-        print(f"\n\n--- Stats ---")
-        print(f"  Total chunks: {chunk_count}")
-        print(f"  Total length: {len(full_response)} chars")
+            chunks.append(chunk)
+            buf.append(chunk)
+            buf_len += len(chunk)
+            # 512자 이상 쌓이거나 줄바꿈이 오면 한 번에 출력
+            if buf_len >= 512 or "\n" in chunk:
+                log("".join(buf), end="", flush=True)
+                buf.clear()
+                buf_len = 0
+
+        if buf:
+            log("".join(buf), end="", flush=True)
+        full_response = "".join(chunks)
+
+        log(f"\n\n--- Stats ---")
+        log(f"  Total chunks: {len(chunks)}")
+        log(f"  Total length: {len(full_response)} chars")
         return True
 
     except OllamaConnectionError as e:
@@ -195,9 +228,9 @@ async def test_chat_stream():
 
 async def test_generate():
     """단순 생성 테스트"""
-    print("\n" + "=" * 60)
-    print("TEST: Generate")
-    print("=" * 60)
+    log("\n" + _HR)
+    log("TEST: Generate")
+    log(_HR)
 
     client = create_client()
 
@@ -210,12 +243,12 @@ async def test_generate():
             num_predict=128
         )
 
-        print(f"\n--- Prompt ---")
-        print(prompt)
-        print(f"\n--- Response ---")
-        print(response.content)
-        print(f"\n--- Metadata ---")
-        print(f"  Response Time: {response.response_time_ms:.1f}ms")
+        log(f"\n--- Prompt ---")
+        log(prompt)
+        log(f"\n--- Response ---")
+        log(response.content)
+        log(f"\n--- Metadata ---")
+        log(f"  Response Time: {response.response_time_ms:.1f}ms")
         return True
 
     except Exception as e:
@@ -225,21 +258,21 @@ async def test_generate():
 
 async def test_check_model():
     """모델 존재 확인 테스트"""
-    print("\n" + "=" * 60)
-    print("TEST: Check Model Exists")
-    print("=" * 60)
+    log("\n" + _HR)
+    log("TEST: Check Model Exists")
+    log(_HR)
 
     client = create_client()
 
     # 현재 설정된 모델 확인
-    print(f"\nChecking configured model: {client.model}")
+    log(f"\nChecking configured model: {client.model}")
     exists = await client.check_model_exists()
-    print(f"Result: {'EXISTS' if exists else 'NOT FOUND'}")
+    log(f"Result: {'EXISTS' if exists else 'NOT FOUND'}")
 
     # 없는 모델 확인
-    print(f"\nChecking non-existent model: fake-model:latest")
+    log(f"\nChecking non-existent model: fake-model:latest")
     exists = await client.check_model_exists("fake-model:latest")
-    print(f"Result: {'EXISTS' if exists else 'NOT FOUND'} (expected: NOT FOUND)")
+    log(f"Result: {'EXISTS' if exists else 'NOT FOUND'} (expected: NOT FOUND)")
 
     return True
 
@@ -272,47 +305,57 @@ async def run_all_tests():
     # 7. Generate
     results['generate'] = await test_generate()
 
-    # Summary
-    print("\n" + "=" * 60)
-    print("TEST SUMMARY")
-    print("=" * 60)
-    for test_name, passed in results.items():
-        status = "PASS" if passed else "FAIL"
-        print(f"  {test_name}: {status}")
-
+    # Summary (한 번에 출력)
     passed_count = sum(1 for v in results.values() if v)
     total_count = len(results)
-    print(f"\nTotal: {passed_count}/{total_count} passed")
+    lines = ["", _HR, "TEST SUMMARY", _HR]
+    lines.extend(
+        f"  {test_name}: {'PASS' if passed else 'FAIL'}"
+        for test_name, passed in results.items()
+    )
+    lines.append(f"\nTotal: {passed_count}/{total_count} passed")
+    sys.stdout.write("\n".join(lines) + "\n")
 
     return results
 
 
+_BANNER = f"{_HR}\nOllamaClient Test Script\n{_HR}"
+
+_TEST_MAP = {
+    'health': test_health_check,
+    'models': test_list_models,
+    'chat': test_chat,
+    'stream': test_chat_stream,
+    'generate': test_generate,
+    'check': test_check_model,
+    'system': test_chat_with_system_prompt,
+    'all': run_all_tests
+}
+
+
 def main():
     parser = argparse.ArgumentParser(description='OllamaClient 테스트')
     parser.add_argument(
         '--test',
-        choices=['health', 'models', 'chat', 'stream', 'generate', 'check', 'system', 'all'],
+        choices=list(_TEST_MAP),
         default='all',
         help='실행할 테스트 (기본: all)'
     )
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='상세 출력 생략 (요약/오류만 출력)'
+    )
     args = parser.parse_args()
 
-    test_map = {
-        'health': test_health_check,
-        'models': test_list_models,
-        'chat': test_chat,
-        'stream': test_chat_stream,
-        'generate': test_generate,
-        'check': test_check_model,
-        'system': test_chat_with_system_prompt,
-        'all': run_all_tests
-    }
-
-    print("=" * 60)
-    print("OllamaClient Test Script")
-    print("=" * 60)
-
-    asyncio.run(test_map[args.test]())
+    global QUIET
+    QUIET = args.quiet
+
+    print(_BANNER)
+
+    loop_factory = uvloop.new_event_loop if uvloop else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(_TEST_MAP[args.test]())
 
 
 if __name__ == "__main__":
@@ -1,30 +1,59 @@
+import logging
 import pytest
+import pytest_asyncio
 from httpx import AsyncClient, ASGITransport
 from fastapi.testclient import TestClient
 from unittest.mock import patch, MagicMock
+from fastapi import HTTPException, status
 
-from main_http import root as app
+from main_http import root
+
+
+# ─────────────────────────────────────────────
+# 비동기 테스트 이벤트 루프 (세션 공유)
+# ─────────────────────────────────────────────
+
+def pytest_collection_modifyitems(items):
+    """모든 async 테스트를 세션 이벤트 루프에서 실행 (테스트마다 루프 생성/종료 생략)"""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
 
 
 # ─────────────────────────────────────────────
 # TestClient Fixture
 # ─────────────────────────────────────────────
 
-@pytest.fixture
-def client():
-    """동기 테스트 클라이언트"""
-    with TestClient(app) as c:
-        yield c
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def started_app():
+    """lifespan 진입 상태의 앱 (세션 1회, client/async_client 공유 → ChatService 단일 인스턴스)"""
+    async with root.router.lifespan_context(root):
+        yield root
 
 
-@pytest.fixture
-async def async_client():
-    """비동기 테스트 클라이언트"""
-    transport = ASGITransport(app=app)
+@pytest.fixture(scope="session")
+def client(started_app):
+    """동기 테스트 클라이언트 (세션 전체 공유, lifespan은 started_app에서 1회 실행)"""
+    return TestClient(started_app)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_client(started_app):
+    """비동기 테스트 클라이언트 (세션 전체 공유, lifespan은 started_app에서 1회 실행)"""
+    transport = ASGITransport(app=started_app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
 
 
+@pytest.fixture(autouse=True)
+def reset_client_cookies(request):
+    """공유 클라이언트 쿠키 초기화 (테스트 간 쿠키 누수 방지)"""
+    for name in ("client", "async_client"):
+        if name in request.fixturenames:
+            request.getfixturevalue(name).cookies.clear()
+
+
 # ─────────────────────────────────────────────
 # Mock Auth Fixture (자체 JWT 검증 Mock)
 # ─────────────────────────────────────────────
@@ -41,44 +70,58 @@ def mock_jwt_payload():
     }
 
 
-@pytest.fixture
-def mock_auth_success(mock_jwt_payload):
-    """인증 성공 Mock"""
-    with patch(
-        "apps.chatbot.deps.auth.verify_token",
-        return_value=mock_jwt_payload
-    ):
-        yield mock_jwt_payload
+# 인증 Mock 대상 (apps.chatbot.deps 의 Auth 인스턴스)
+AUTH_VERIFY_TARGET = "apps.chatbot.deps.auth.verify_token"
+
+AUTH_INVALID_TOKEN_ERROR = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Invalid or expired token"
+)
+
+AUTH_SERVICE_UNAVAILABLE_ERROR = HTTPException(
+    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+    detail="Auth service unavailable"
+)
 
 
 @pytest.fixture
-def mock_auth_failure():
-    """인증 실패 Mock (401)"""
-    from fastapi import HTTPException, status
+def mock_auth(request, mock_jwt_payload):
+    """인증 Mock (기본 "success", indirect 파라미터로 "401" | "503" 지정)
 
-    with patch(
-        "apps.chatbot.deps.auth.verify_token",
-        side_effect=HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token"
-        )
-    ):
-        yield
+    사용법:
+        def test_xxx(mock_auth): ...  # 인증 성공
+        @pytest.mark.parametrize("mock_auth", ["401"], indirect=True)
+    """
+    outcome = getattr(request, "param", "success")
 
+    if outcome == "success":
+        patch_kwargs = {"return_value": mock_jwt_payload}
+    elif outcome == "401":
+        patch_kwargs = {"side_effect": AUTH_INVALID_TOKEN_ERROR}
+    elif outcome == "503":
+        patch_kwargs = {"side_effect": AUTH_SERVICE_UNAVAILABLE_ERROR}
+    else:
+        raise ValueError(f"Unknown mock_auth outcome: {outcome}")
 
-@pytest.fixture
-def mock_auth_service_unavailable():
-    """Auth 서비스 불가 Mock (503)"""
-    from fastapi import HTTPException, status
-
-    with patch(
-        "apps.chatbot.deps.auth.verify_token",
-        side_effect=HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Auth service unavailable"
-        )
-    ):
-        yield
+    with patch(AUTH_VERIFY_TARGET, **patch_kwargs):
+        yield mock_jwt_payload if outcome == "success" else None
+
+
+# ─────────────────────────────────────────────
+# Auth Fixture (세션 1회 생성)
+# ─────────────────────────────────────────────
+
+@pytest.fixture(scope="session")
+def auth_singleton():
+    """실제 Auth 인스턴스 (DB 세션 팩토리 Mock)
+
+    -n 병렬 실행 시에도 xdist 워커는 별도 프로세스이므로 워커당 1회 생성된다.
+    """
+    from class_lib.auth import Auth
+
+    with patch("class_lib.auth.ConfigDB") as mock_db:
+        mock_db.return_value.get_session_factory.return_value = MagicMock()
+        return Auth(logging.getLogger("test"))
 
 
 # ─────────────────────────────────────────────
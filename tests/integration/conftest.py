@@ -0,0 +1,36 @@
+import pytest
+from unittest.mock import patch, AsyncMock
+
+from class_lib.chat_service import ChatService, ChatResult
+
+
+# ─────────────────────────────────────────────
+# Fake Backend Fixture (LLM / Redis 호출 차단)
+# ─────────────────────────────────────────────
+
+FAKE_CHAT_RESULT = ChatResult(
+    text="ok",
+    charts=[],
+    session_id="test-session",
+    model="qwen2.5:7b",
+    response_time_ms=1.0,
+    tokens={"prompt": 1, "completion": 1, "total": 2},
+    skill_name="badminton",
+    message_count=2
+)
+
+
+async def _fake_chat_stream(self, **kwargs):
+    """고정 응답 스트림"""
+    yield FAKE_CHAT_RESULT.text
+
+
+@pytest.fixture
+def fake_backends():
+    """ChatService.chat / chat_stream Mock (채팅 API 테스트에서 명시적으로 요청)
+
+    API 테스트는 응답 구조만 검증하므로 Ollama/Redis 대신 고정 결과를 반환한다.
+    """
+    with patch.object(ChatService, "chat", AsyncMock(return_value=FAKE_CHAT_RESULT)), \
+            patch.object(ChatService, "chat_stream", _fake_chat_stream):
+        yield
@@ -1,6 +1,9 @@
 import pytest
 
 
+pytestmark = pytest.mark.usefixtures("fake_backends")
+
+
 class TestChatEndpointAuth:
     """POST /api/chat/ 인증 테스트"""
 
@@ -16,33 +19,26 @@ class TestChatEndpointAuth:
         assert "token" in response.json()["detail"].lower()
 
     @pytest.mark.asyncio
-    async def test_chat_with_invalid_token(self, async_client, mock_auth_failure, auth_headers):
-        """잘못된 토큰으로 요청 시 401"""
-        response = await async_client.post(
-            "/api/chat/",
-            json={"message": "테스트 메시지"},
-            headers=auth_headers
-        )
-
-        assert response.status_code == 401
-
-    @pytest.mark.asyncio
-    async def test_chat_auth_service_unavailable(self, async_client, mock_auth_service_unavailable, auth_headers):
-        """Auth 서비스 장애 시 503"""
+    @pytest.mark.parametrize("mock_auth, expected_status", [
+        ("401", 401),  # 잘못된 토큰
+        ("503", 503),  # Auth 서비스 장애
+    ], indirect=["mock_auth"])
+    async def test_chat_auth_failure(self, async_client, mock_auth, auth_headers, expected_status):
+        """인증 실패 시 verify_token 오류 상태 코드 전달"""
         response = await async_client.post(
             "/api/chat/",
             json={"message": "테스트 메시지"},
             headers=auth_headers
         )
 
-        assert response.status_code == 503
+        assert response.status_code == expected_status
 
 
 class TestChatEndpointSuccess:
     """POST /api/chat/ 성공 케이스"""
 
     @pytest.mark.asyncio
-    async def test_chat_with_bearer_token(self, async_client, mock_auth_success, auth_headers):
+    async def test_chat_with_bearer_token(self, async_client, mock_auth, auth_headers):
         """Bearer 토큰으로 인증 성공"""
         response = await async_client.post(
             "/api/chat/",
@@ -56,7 +52,7 @@ class TestChatEndpointSuccess:
         assert "model" in data
 
     @pytest.mark.asyncio
-    async def test_chat_with_cookie(self, async_client, mock_auth_success, valid_token):
+    async def test_chat_with_cookie(self, async_client, mock_auth, valid_token):
         """쿠키로 인증 성공"""
         async_client.cookies.set("access_token", valid_token)
 
@@ -68,7 +64,7 @@ class TestChatEndpointSuccess:
         assert response.status_code == 200
 
     @pytest.mark.asyncio
-    async def test_chat_response_format(self, async_client, mock_auth_success, auth_headers):
+    async def test_chat_response_format(self, async_client, mock_auth, auth_headers):
         """응답 형식 확인"""
         response = await async_client.post(
             "/api/chat/",
@@ -86,48 +82,31 @@ class TestChatEndpointInput:
     """POST /api/chat/ 입력 테스트"""
 
     @pytest.mark.asyncio
-    async def test_chat_with_context_type(self, async_client, mock_auth_success, auth_headers):
-        """context_type 지정"""
-        response = await async_client.post(
-            "/api/chat/",
-            json={
-                "message": "경기 분석해줘",
-                "context_type": "badminton"
-            },
-            headers=auth_headers
-        )
-
-        assert response.status_code == 200
-
-    @pytest.mark.asyncio
-    async def test_chat_default_context_type(self, async_client, mock_auth_success, auth_headers):
-        """context_type 기본값 (badminton)"""
+    @pytest.mark.parametrize("body", [
+        {"message": "경기 분석해줘", "context_type": "badminton"},  # context_type 지정
+        {"message": "테스트"},  # context_type 기본값 (badminton)
+    ])
+    async def test_chat_valid_body(self, async_client, mock_auth, auth_headers, body):
+        """유효한 요청 본문"""
         response = await async_client.post(
             "/api/chat/",
-            json={"message": "테스트"},
+            json=body,
             headers=auth_headers
         )
 
         assert response.status_code == 200
 
     @pytest.mark.asyncio
-    async def test_chat_missing_message_field(self, async_client, mock_auth_success, auth_headers):
-        """message 필드 누락 시 422"""
-        response = await async_client.post(
-            "/api/chat/",
-            json={"context_type": "badminton"},
-            headers=auth_headers
-        )
-
-        assert response.status_code == 422
-
-    @pytest.mark.asyncio
-    async def test_chat_invalid_json(self, async_client, mock_auth_success, auth_headers):
-        """잘못된 JSON 형식"""
+    @pytest.mark.parametrize("request_kwargs", [
+        {"json": {"context_type": "badminton"}},  # message 필드 누락
+        {"content": "invalid json"},  # 잘못된 JSON 형식
+    ])
+    async def test_chat_invalid_body(self, async_client, mock_auth, auth_headers, request_kwargs):
+        """잘못된 요청 본문 시 422"""
         response = await async_client.post(
             "/api/chat/",
-            content="invalid json",
-            headers={**auth_headers, "Content-Type": "application/json"}
+            headers={**auth_headers, "Content-Type": "application/json"},
+            **request_kwargs
         )
 
         assert response.status_code == 422
@@ -1,6 +1,15 @@
 import pytest
 
 
+@pytest.fixture(scope="module")
+def openapi_schema(client):
+    """OpenAPI 스키마 (모듈 내 1회 조회)"""
+    response = client.get("/api/openapi.json")
+
+    assert response.status_code == 200
+    return response.json()
+
+
 class TestHelloEndpoint:
     """GET /api/chat/hello/{name} 테스트"""
 
@@ -58,19 +67,14 @@ class TestSwaggerDocs:
         assert response.status_code == 200
         assert "text/html" in response.headers["content-type"]
 
-    def test_openapi_json_available(self, client):
+    def test_openapi_json_available(self, openapi_schema):
         """OpenAPI JSON 접근 가능"""
-        response = client.get("/api/openapi.json")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert "openapi" in data
-        assert "paths" in data
+        assert "openapi" in openapi_schema
+        assert "paths" in openapi_schema
 
-    def test_openapi_paths_exist(self, client):
+    def test_openapi_paths_exist(self, openapi_schema):
         """필수 경로 존재 확인"""
-        response = client.get("/api/openapi.json")
-        paths = response.json()["paths"]
+        paths = openapi_schema["paths"]
 
         assert "/api/chat/hello/{name}" in paths
         assert "/api/chat/health" in paths
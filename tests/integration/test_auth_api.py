@@ -1,7 +1,12 @@
+import re
+import orjson
 import pytest
+from functools import lru_cache
 from unittest.mock import patch, MagicMock
 from fastapi import HTTPException, status
 
+from apps.auth.router import auth as _auth
+
 
 # ─────────────────────────────────────────────
 # 테스트용 상수
@@ -24,6 +29,24 @@ LOGIN_URL = "/api/auth/login"
 LOGOUT_URL = "/api/auth/logout"
 USERINFO_URL = "/api/auth/userinfo"
 
+# 삭제된 쿠키 (Max-Age=0 또는 과거 expires) — Set-Cookie 헤더 한 줄 단위 매칭
+_DELETED_COOKIE_RE = re.compile(
+    r"^(access_token|refresh_token)=[^\n]*?(?:max-age=0|expires=thu, 01 jan 1970)",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+# 사전 인코딩된 로그인 요청 본문 (모듈 로드 시 1회)
+JSON_HEADERS = {"content-type": "application/json"}
+_LOGIN_BODY = orjson.dumps({"email": TEST_EMAIL, "password": TEST_PASSWORD})
+_LOGIN_BODY_UNKNOWN_EMAIL = orjson.dumps({"email": "unknown@example.com", "password": TEST_PASSWORD})
+_LOGIN_BODY_WRONG_PASSWORD = orjson.dumps({"email": TEST_EMAIL, "password": "wrong-password"})
+
+
+def rj(response):
+    """응답 본문 JSON 파싱 (orjson)"""
+    return orjson.loads(response.content)
+
 
 # ─────────────────────────────────────────────
 # Auth Mock Fixtures
@@ -74,12 +97,25 @@ def mock_auth_delete_refresh_token():
         yield
 
 
-@pytest.fixture
+@lru_cache(maxsize=16)
+def _mint(email: str, role: str) -> str:
+    """실제 Auth 클래스로 access_token 생성 (동일 email/role 재사용)"""
+    return _auth.create_access_token(email, role)
+
+
+@pytest.fixture(scope="session")
 def real_access_token():
-    """실제 Auth 클래스로 생성한 유효한 access_token"""
-    from apps.auth.router import auth
+    """실제 Auth 클래스로 생성한 유효한 access_token (세션 전체 공유)"""
+    return _mint(TEST_EMAIL, TEST_ROLE)
+
 
-    return auth.create_access_token(TEST_EMAIL, TEST_ROLE)
+@pytest.fixture
+def authed_client(async_client, real_access_token):
+    """access_token 쿠키가 설정된 클라이언트 (종료 시 쿠키 초기화)"""
+    async_client.cookies.clear()
+    async_client.cookies.set("access_token", real_access_token)
+    yield async_client
+    async_client.cookies.clear()
 
 
 # ─────────────────────────────────────────────
@@ -89,67 +125,61 @@ def real_access_token():
 class TestLoginEndpoint:
     """POST /api/auth/login 테스트"""
 
-    def test_login_success(self, client, mock_auth_login_success):
-        """정상 로그인 -> 200, msg='login successful', access_token 포함"""
-        response = client.post(
+    async def test_login_success(self, async_client, mock_auth_login_success):
+        """정상 로그인 -> 200, access_token 반환 + access/refresh 쿠키 설정"""
+        response = await async_client.post(
             LOGIN_URL,
-            json={"email": TEST_EMAIL, "password": TEST_PASSWORD},
+            content=_LOGIN_BODY,
+            headers=JSON_HEADERS,
         )
 
         assert response.status_code == 200
-        data = response.json()
+
+        # 응답 본문
+        data = rj(response)
         assert data["msg"] == "login successful"
         assert "access_token" in data
         assert data["token_type"] == "bearer"
         assert len(data["access_token"]) > 0
 
-    def test_login_sets_cookies(self, client, mock_auth_login_success):
-        """응답에 access_token, refresh_token 쿠키 설정 확인"""
-        response = client.post(
-            LOGIN_URL,
-            json={"email": TEST_EMAIL, "password": TEST_PASSWORD},
-        )
-
-        assert response.status_code == 200
-
+        # 쿠키
         cookies = response.cookies
         assert "access_token" in cookies
         assert "refresh_token" in cookies
         assert len(cookies["access_token"]) > 0
         assert len(cookies["refresh_token"]) > 0
 
-    def test_login_wrong_email(self, client, mock_auth_login_wrong_email):
+    async def test_login_wrong_email(self, async_client, mock_auth_login_wrong_email):
         """존재하지 않는 email -> 401"""
-        response = client.post(
+        response = await async_client.post(
             LOGIN_URL,
-            json={"email": "unknown@example.com", "password": TEST_PASSWORD},
+            content=_LOGIN_BODY_UNKNOWN_EMAIL,
+            headers=JSON_HEADERS,
         )
 
         assert response.status_code == 401
-        assert "User not found" in response.json()["detail"]
+        assert "User not found" in rj(response)["detail"]
 
-    def test_login_wrong_password(self, client, mock_auth_login_wrong_password):
+    async def test_login_wrong_password(self, async_client, mock_auth_login_wrong_password):
         """잘못된 password -> 401"""
-        response = client.post(
+        response = await async_client.post(
             LOGIN_URL,
-            json={"email": TEST_EMAIL, "password": "wrong-password"},
+            content=_LOGIN_BODY_WRONG_PASSWORD,
+            headers=JSON_HEADERS,
         )
 
         assert response.status_code == 401
-        assert "Invalid password" in response.json()["detail"]
-
-    def test_login_missing_fields(self, client):
+        assert "Invalid password" in rj(response)["detail"]
+
+    @pytest.mark.parametrize("body", [
+        orjson.dumps({"password": TEST_PASSWORD}),  # email 누락
+        orjson.dumps({"email": TEST_EMAIL}),        # password 누락
+        orjson.dumps({}),                           # 빈 body
+    ])
+    async def test_login_missing_fields(self, async_client, body):
         """email/password 누락 -> 422"""
-        # email 누락
-        response = client.post(LOGIN_URL, json={"password": TEST_PASSWORD})
-        assert response.status_code == 422
+        response = await async_client.post(LOGIN_URL, content=body, headers=JSON_HEADERS)
 
-        # password 누락
-        response = client.post(LOGIN_URL, json={"email": TEST_EMAIL})
-        assert response.status_code == 422
-
-        # 빈 body
-        response = client.post(LOGIN_URL, json={})
         assert response.status_code == 422
 
 
@@ -160,44 +190,27 @@ class TestLoginEndpoint:
 class TestLogoutEndpoint:
     """POST /api/auth/logout 테스트"""
 
-    def test_logout_success(self, client, real_access_token, mock_auth_delete_refresh_token):
-        """로그아웃 -> 200 + 쿠키 삭제"""
-        client.cookies.set("access_token", real_access_token)
-
-        response = client.post(LOGOUT_URL)
-
-        assert response.status_code == 200
-        assert response.json()["msg"] == "logout successful"
-
-    def test_logout_without_token(self, client):
+    async def test_logout_without_token(self, async_client):
         """토큰 없이도 로그아웃 성공 (에러 없음)"""
-        response = client.post(LOGOUT_URL)
+        response = await async_client.post(LOGOUT_URL)
 
         assert response.status_code == 200
-        assert response.json()["msg"] == "logout successful"
+        assert rj(response)["msg"] == "logout successful"
 
-    def test_logout_clears_cookies(self, client, real_access_token, mock_auth_delete_refresh_token):
-        """access_token, refresh_token 쿠키 삭제 확인"""
-        client.cookies.set("access_token", real_access_token)
-        client.cookies.set("refresh_token", "test-refresh-token")
+    async def test_logout_success(self, authed_client, mock_auth_delete_refresh_token):
+        """로그아웃 -> 200 + access_token, refresh_token 쿠키 삭제"""
+        authed_client.cookies.set("refresh_token", "test-refresh-token")
 
-        response = client.post(LOGOUT_URL)
+        response = await authed_client.post(LOGOUT_URL)
 
         assert response.status_code == 200
+        assert rj(response)["msg"] == "logout successful"
 
         # Set-Cookie 헤더에서 삭제 확인 (max-age=0 또는 expires=과거)
         set_cookie_headers = response.headers.get_list("set-cookie")
-        cookie_names_deleted = []
-        for header in set_cookie_headers:
-            header_lower = header.lower()
-            if "max-age=0" in header_lower or 'expires=thu, 01 jan 1970' in header_lower:
-                if "access_token" in header:
-                    cookie_names_deleted.append("access_token")
-                if "refresh_token" in header:
-                    cookie_names_deleted.append("refresh_token")
+        cookie_names_deleted = set(_DELETED_COOKIE_RE.findall("\n".join(set_cookie_headers)))
 
-        assert "access_token" in cookie_names_deleted
-        assert "refresh_token" in cookie_names_deleted
+        assert {"access_token", "refresh_token"} <= cookie_names_deleted
 
 
 # ─────────────────────────────────────────────
@@ -207,41 +220,39 @@ class TestLogoutEndpoint:
 class TestUserinfoEndpoint:
     """GET /api/auth/userinfo 테스트"""
 
-    def test_userinfo_with_cookie(self, client, real_access_token):
+    async def test_userinfo_with_cookie(self, authed_client):
         """access_token 쿠키 -> 200 + email, role"""
-        client.cookies.set("access_token", real_access_token)
-
-        response = client.get(USERINFO_URL)
+        response = await authed_client.get(USERINFO_URL)
 
         assert response.status_code == 200
-        data = response.json()
+        data = rj(response)
         assert data["email"] == TEST_EMAIL
         assert data["role"] == TEST_ROLE
 
-    def test_userinfo_with_bearer(self, client, real_access_token):
+    async def test_userinfo_with_bearer(self, async_client, real_access_token):
         """Authorization: Bearer -> 200"""
-        response = client.get(
+        response = await async_client.get(
             USERINFO_URL,
             headers={"Authorization": f"Bearer {real_access_token}"},
         )
 
         assert response.status_code == 200
-        data = response.json()
+        data = rj(response)
         assert data["email"] == TEST_EMAIL
         assert data["role"] == TEST_ROLE
 
-    def test_userinfo_no_token(self, client):
+    async def test_userinfo_no_token(self, async_client):
         """토큰 없음 -> 401"""
-        response = client.get(USERINFO_URL)
+        response = await async_client.get(USERINFO_URL)
 
         assert response.status_code == 401
-        assert "No access token" in response.json()["detail"]
+        assert "No access token" in rj(response)["detail"]
 
-    def test_userinfo_invalid_token(self, client):
+    async def test_userinfo_invalid_token(self, async_client):
         """잘못된 토큰 -> 401"""
-        client.cookies.set("access_token", "invalid-jwt-token-string")
+        async_client.cookies.set("access_token", "invalid-jwt-token-string")
 
-        response = client.get(USERINFO_URL)
+        response = await async_client.get(USERINFO_URL)
 
         assert response.status_code == 401
-        assert "Token error" in response.json()["detail"]
+        assert "Token error" in rj(response)["detail"]
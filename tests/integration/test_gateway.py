@@ -0,0 +1,107 @@
+"""샘플 게이트웨이 TokenInjectionMiddleware 테스트"""
+
+import os
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import HTMLResponse
+from fastapi.staticfiles import StaticFiles
+from fastapi.testclient import TestClient
+
+from embed.samples import gateway
+
+
+PLACEHOLDER_HTML = (
+    f'<spo-chatbot api-url="{gateway.API_URL_PLACEHOLDER}" '
+    f'token="{gateway.DEV_TEST_TOKEN}"></spo-chatbot>'
+)
+
+
+@pytest.fixture
+def built_dir(tmp_path, monkeypatch):
+    """빌드 산출물 디렉토리 (/sample/demo/, 플레이스홀더 캐시 초기화)"""
+    (tmp_path / "plain.js").write_text("console.log('plain');", encoding="utf-8")
+    monkeypatch.setattr(gateway, "_BUILT_SAMPLE_DIRS", {"demo": tmp_path})
+    monkeypatch.setattr(gateway, "_placeholder_cache", {})
+    return tmp_path
+
+
+@pytest.fixture
+def gateway_client(built_dir):
+    """TokenInjectionMiddleware만 적용한 테스트 앱"""
+    app = FastAPI()
+    app.add_middleware(gateway.TokenInjectionMiddleware)
+
+    @app.get("/page", response_class=HTMLResponse)
+    async def page():
+        return PLACEHOLDER_HTML
+
+    @app.post("/page", response_class=HTMLResponse)
+    async def post_page():
+        return PLACEHOLDER_HTML
+
+    @app.get("/missing", response_class=HTMLResponse)
+    async def missing():
+        return HTMLResponse(PLACEHOLDER_HTML, status_code=404)
+
+    app.mount("/sample/demo", StaticFiles(directory=str(built_dir), html=True), name="demo")
+
+    return TestClient(app)
+
+
+class TestPlaceholderReplacement:
+    """플레이스홀더 치환"""
+
+    def test_token_replaced(self, gateway_client):
+        """?token= 값으로 dev-test-token 치환"""
+        response = gateway_client.get("/page", params={"token": "real-token"})
+
+        assert response.status_code == 200
+        assert 'token="real-token"' in response.text
+        assert gateway.DEV_TEST_TOKEN not in response.text
+
+    def test_api_url_replaced(self, gateway_client):
+        """__CHATBOT_API_URL__ → CHATBOT_API_URL 치환 (토큰 없으면 dev 토큰 유지)"""
+        response = gateway_client.get("/page")
+
+        assert f'api-url="{gateway.CHATBOT_API_URL}"' in response.text
+        assert gateway.API_URL_PLACEHOLDER not in response.text
+        assert f'token="{gateway.DEV_TEST_TOKEN}"' in response.text
+
+
+class TestPassthrough:
+    """치환 없이 통과"""
+
+    def test_placeholder_free_asset_unchanged(self, gateway_client, built_dir):
+        """플레이스홀더 없는 빌드 산출물은 원본 그대로"""
+        response = gateway_client.get("/sample/demo/plain.js", params={"token": "real-token"})
+
+        assert response.status_code == 200
+        assert response.text == (built_dir / "plain.js").read_text(encoding="utf-8")
+        assert gateway._is_passthrough("/sample/demo/plain.js") is True
+
+    def test_rebuilt_asset_rechecked(self, gateway_client, built_dir):
+        """같은 이름으로 재빌드되어 플레이스홀더가 생기면 치환 대상으로 전환"""
+        gateway_client.get("/sample/demo/plain.js")
+
+        asset = built_dir / "plain.js"
+        asset.write_text(f"const API = '{gateway.API_URL_PLACEHOLDER}';", encoding="utf-8")
+        stat = asset.stat()
+        os.utime(asset, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        response = gateway_client.get("/sample/demo/plain.js")
+
+        assert response.text == f"const API = '{gateway.CHATBOT_API_URL}';"
+
+    def test_non_get_unchanged(self, gateway_client):
+        """GET 이외 요청은 치환 없음"""
+        response = gateway_client.post("/page", params={"token": "real-token"})
+
+        assert response.text == PLACEHOLDER_HTML
+
+    def test_non_200_unchanged(self, gateway_client):
+        """200 이외 응답은 치환 없음"""
+        response = gateway_client.get("/missing", params={"token": "real-token"})
+
+        assert response.status_code == 404
+        assert response.text == PLACEHOLDER_HTML
@@ -1,10 +1,35 @@
-import pytest
+import base64
 import bcrypt
+import hashlib
+import hmac
+import json
+import pytest
 from datetime import datetime, timedelta, timezone
 from unittest.mock import patch, MagicMock
 from fastapi import HTTPException
 import jwt
 
+from class_lib.auth import Auth
+
+
+# ─────────────────────────────────────────────
+# HS256 서명 헬퍼 (PyJWT 우회)
+# ─────────────────────────────────────────────
+
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+_HS256_HEADER_B64 = _b64url(b'{"alg":"HS256","typ":"JWT"}')
+
+
+def _sign(payload: dict, secret: str) -> str:
+    """테스트용 HS256 JWT 직접 서명 (datetime claim은 epoch 초로 변환)"""
+    claims = {k: int(v.timestamp()) if isinstance(v, datetime) else v for k, v in payload.items()}
+    signing_input = _HS256_HEADER_B64 + b"." + _b64url(json.dumps(claims, separators=(",", ":")).encode())
+    signature = hmac.new(secret.encode(), signing_input, hashlib.sha256).digest()
+    return (signing_input + b"." + _b64url(signature)).decode()
+
 
 # ─────────────────────────────────────────────
 # TestAuthTokens (토큰 생성/검증)
@@ -16,9 +41,9 @@ class TestAuthTokens:
 
     TEST_SECRET = "test-secret-key-12345"
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def auth(self):
-        """Auth 인스턴스 생성 (Config, ConfigDB Mock)"""
+        """Auth 인스턴스 생성 (Config, ConfigDB Mock, 클래스 내 공유)"""
         with patch("class_lib.auth.Config") as mock_config, \
              patch("class_lib.auth.ConfigDB") as mock_db:
             mock_config.return_value.jwt_secret_key = self.TEST_SECRET
@@ -26,18 +51,21 @@ class TestAuthTokens:
             mock_session = MagicMock()
             mock_db.return_value.get_session_factory.return_value = lambda: mock_session
 
-            from class_lib.auth import Auth
             mock_logger = MagicMock()
             return Auth(mock_logger)
 
-    def test_create_access_token_success(self, auth):
-        """Access Token 생성 후 디코딩하여 payload 확인"""
+    @pytest.fixture(scope="class")
+    def decoded_access(self, auth):
+        """Access Token + 디코딩된 payload (클래스 내 1회 생성/검증)"""
         token = auth.create_access_token("user@test.com", "admin")
+        return token, jwt.decode(token, self.TEST_SECRET, algorithms=["HS256"])
+
+    def test_create_access_token_success(self, decoded_access):
+        """Access Token 생성 후 디코딩하여 payload 확인"""
+        token, payload = decoded_access
 
         assert isinstance(token, str)
         assert len(token) > 0
-
-        payload = jwt.decode(token, self.TEST_SECRET, algorithms=["HS256"])
         assert payload["email"] == "user@test.com"
         assert payload["role"] == "admin"
 
@@ -66,26 +94,29 @@ class TestAuthTokens:
 
     def test_create_refresh_token_custom_expiry(self, auth):
         """사용자 지정 expires_days 동작 확인"""
-        token_default = auth.create_refresh_token("user@test.com", "admin")
-        token_custom = auth.create_refresh_token("user@test.com", "admin", expires_days=30)
+        # 서명 없이 jwt.encode에 전달된 payload만 캡처
+        with patch("class_lib.auth.jwt.encode", side_effect=lambda payload, *a, **k: payload) as enc:
+            auth.create_refresh_token("user@test.com", "admin")
+            auth.create_refresh_token("user@test.com", "admin", expires_days=30)
 
-        payload_default = jwt.decode(token_default, self.TEST_SECRET, algorithms=["HS256"])
-        payload_custom = jwt.decode(token_custom, self.TEST_SECRET, algorithms=["HS256"])
+        payload_default = enc.call_args_list[0].args[0]
+        payload_custom = enc.call_args_list[1].args[0]
 
         # custom(30일)이 default(7일)보다 만료 시간이 길어야 함
         assert payload_custom["exp"] > payload_default["exp"]
 
         # 만료 시간 차이가 약 23일 (30-7)
-        diff_seconds = payload_custom["exp"] - payload_default["exp"]
+        diff_seconds = (payload_custom["exp"] - payload_default["exp"]).total_seconds()
         expected_diff = 23 * 24 * 60 * 60  # 23일 (초)
         assert abs(diff_seconds - expected_diff) < 60  # 1분 이내 오차 허용
 
-    def test_verify_token_success(self, auth):
+    def test_verify_token_success(self, auth, decoded_access):
         """create_access_token으로 만든 토큰을 verify_token으로 검증"""
-        token = auth.create_access_token("user@test.com", "admin")
+        token, expected = decoded_access
 
         payload = auth.verify_token(token)
 
+        assert payload == expected
         assert payload["email"] == "user@test.com"
         assert payload["role"] == "admin"
         assert payload["type"] == "access"
@@ -99,7 +130,7 @@ class TestAuthTokens:
             "exp": datetime.now(timezone.utc) - timedelta(hours=1),
             "iat": datetime.now(timezone.utc) - timedelta(hours=25)
         }
-        expired_token = jwt.encode(expired_payload, self.TEST_SECRET, algorithm="HS256")
+        expired_token = _sign(expired_payload, self.TEST_SECRET)
 
         with pytest.raises(HTTPException) as exc_info:
             auth.verify_token(expired_token)
@@ -116,7 +147,7 @@ class TestAuthTokens:
             "exp": datetime.now(timezone.utc) + timedelta(hours=24),
             "iat": datetime.now(timezone.utc)
         }
-        token = jwt.encode(payload, wrong_secret, algorithm="HS256")
+        token = _sign(payload, wrong_secret)
 
         with pytest.raises(HTTPException) as exc_info:
             auth.verify_token(token)
@@ -136,33 +167,59 @@ class TestAuthTokens:
 # ─────────────────────────────────────────────
 
 
+class _Result:
+    """session.execute() 결과 스텁 (.mappings().all() 지원)"""
+
+    def __init__(self, rows):
+        self._rows = rows
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+
 class TestAuthenticateUser:
     """Auth.authenticate_user 단위 테스트"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_session(self):
-        """Mock DB Session"""
+        """Mock DB Session (클래스 내 공유)"""
         return MagicMock()
 
-    @pytest.fixture
+    @pytest.fixture(autouse=True)
+    def reset_mock_session(self, mock_session):
+        """테스트마다 Mock 호출 기록/반환값 초기화"""
+        mock_session.reset_mock(return_value=True, side_effect=True)
+
+    @pytest.fixture(scope="class")
     def auth(self, mock_session):
-        """Auth 인스턴스 생성 (DB Session Mock 주입)"""
+        """Auth 인스턴스 생성 (DB Session Mock 주입, 클래스 내 공유)"""
         with patch("class_lib.auth.Config") as mock_config, \
              patch("class_lib.auth.ConfigDB") as mock_db:
             mock_config.return_value.jwt_secret_key = "test-secret"
             mock_db.return_value.get_session_factory.return_value = lambda: mock_session
 
-            from class_lib.auth import Auth
             mock_logger = MagicMock()
             return Auth(mock_logger)
 
-    def _hash_password(self, password: str) -> str:
-        """테스트용 bcrypt 해시 생성"""
-        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    # bcrypt.checkpw 스텁용 해시 (실제 KDF 연산 없음)
+    _STUB_HASH = "$2b$stub"
+
+    @pytest.fixture(autouse=True)
+    def stub_bcrypt(self, request, monkeypatch):
+        """bcrypt.checkpw 스텁 (correct-password + $2b$ 해시만 일치, slow 테스트는 실제 bcrypt)"""
+        if request.node.get_closest_marker("slow"):
+            return
+        monkeypatch.setattr(
+            "class_lib.auth.bcrypt.checkpw",
+            lambda pw, h: pw == b"correct-password" and h.startswith(b"$2b$")
+        )
 
     def test_authenticate_user_success(self, auth, mock_session):
         """올바른 email/password -> 사용자 정보 반환"""
-        password_hash = self._hash_password("correct-password")
+        password_hash = self._STUB_HASH
         mock_user = {
             "user_id": 1,
             "email": "user@test.com",
@@ -171,7 +228,7 @@ class TestAuthenticateUser:
             "is_active": True,
             "full_name": "Test User"
         }
-        mock_session.execute.return_value.mappings.return_value.all.return_value = [mock_user]
+        mock_session.execute.return_value = _Result([mock_user])
 
         result = auth.authenticate_user("user@test.com", "correct-password")
 
@@ -183,7 +240,7 @@ class TestAuthenticateUser:
 
     def test_authenticate_user_not_found(self, auth, mock_session):
         """존재하지 않는 email -> HTTPException 401"""
-        mock_session.execute.return_value.mappings.return_value.all.return_value = []
+        mock_session.execute.return_value = _Result([])
 
         with pytest.raises(HTTPException) as exc_info:
             auth.authenticate_user("notfound@test.com", "any-password")
@@ -194,7 +251,7 @@ class TestAuthenticateUser:
 
     def test_authenticate_user_wrong_password(self, auth, mock_session):
         """잘못된 password -> HTTPException 401"""
-        password_hash = self._hash_password("correct-password")
+        password_hash = self._STUB_HASH
         mock_user = {
             "user_id": 1,
             "email": "user@test.com",
@@ -203,7 +260,7 @@ class TestAuthenticateUser:
             "is_active": True,
             "full_name": "Test User"
         }
-        mock_session.execute.return_value.mappings.return_value.all.return_value = [mock_user]
+        mock_session.execute.return_value = _Result([mock_user])
 
         with pytest.raises(HTTPException) as exc_info:
             auth.authenticate_user("user@test.com", "wrong-password")
@@ -214,7 +271,7 @@ class TestAuthenticateUser:
 
     def test_authenticate_user_inactive(self, auth, mock_session):
         """is_active=False -> HTTPException 401"""
-        password_hash = self._hash_password("correct-password")
+        password_hash = self._STUB_HASH
         mock_user = {
             "user_id": 2,
             "email": "inactive@test.com",
@@ -223,7 +280,7 @@ class TestAuthenticateUser:
             "is_active": False,
             "full_name": "Inactive User"
         }
-        mock_session.execute.return_value.mappings.return_value.all.return_value = [mock_user]
+        mock_session.execute.return_value = _Result([mock_user])
 
         with pytest.raises(HTTPException) as exc_info:
             auth.authenticate_user("inactive@test.com", "correct-password")
@@ -232,6 +289,27 @@ class TestAuthenticateUser:
         assert "not active" in exc_info.value.detail.lower()
         mock_session.close.assert_called_once()
 
+    @pytest.mark.slow
+    def test_authenticate_user_real_bcrypt(self, auth, mock_session):
+        """실제 bcrypt(기본 cost) 해시로 성공/실패 확인"""
+        password_hash = bcrypt.hashpw(b"correct-password", bcrypt.gensalt()).decode('utf-8')
+        mock_user = {
+            "user_id": 1,
+            "email": "user@test.com",
+            "password_hash": password_hash,
+            "role": "admin",
+            "is_active": True,
+            "full_name": "Test User"
+        }
+        mock_session.execute.return_value = _Result([mock_user])
+
+        result = auth.authenticate_user("user@test.com", "correct-password")
+        assert result["user_id"] == 1
+
+        with pytest.raises(HTTPException) as exc_info:
+            auth.authenticate_user("user@test.com", "wrong-password")
+        assert "invalid password" in exc_info.value.detail.lower()
+
 
 # ─────────────────────────────────────────────
 # TestRefreshToken (DB 저장/삭제)
@@ -241,20 +319,24 @@ class TestAuthenticateUser:
 class TestRefreshToken:
     """Auth Refresh Token DB 저장/삭제 단위 테스트"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_session(self):
-        """Mock DB Session"""
+        """Mock DB Session (클래스 내 공유)"""
         return MagicMock()
 
-    @pytest.fixture
+    @pytest.fixture(autouse=True)
+    def reset_mock_session(self, mock_session):
+        """테스트마다 Mock 호출 기록/반환값 초기화"""
+        mock_session.reset_mock(return_value=True, side_effect=True)
+
+    @pytest.fixture(scope="class")
     def auth(self, mock_session):
-        """Auth 인스턴스 생성 (DB Session Mock 주입)"""
+        """Auth 인스턴스 생성 (DB Session Mock 주입, 클래스 내 공유)"""
         with patch("class_lib.auth.Config") as mock_config, \
              patch("class_lib.auth.ConfigDB") as mock_db:
             mock_config.return_value.jwt_secret_key = "test-secret"
             mock_db.return_value.get_session_factory.return_value = lambda: mock_session
 
-            from class_lib.auth import Auth
             mock_logger = MagicMock()
             return Auth(mock_logger)
 
@@ -262,13 +344,12 @@ class TestRefreshToken:
         """DB에 refresh_token, token_expire_at 저장 확인"""
         auth.save_refresh_token("user@test.com", "refresh-token-value", expires_days=7)
 
-        mock_session.execute.assert_called_once()
-        mock_session.commit.assert_called_once()
-        mock_session.close.assert_called_once()
+        # execute → commit → close 순서로 각 1회 호출
+        method_calls = mock_session.method_calls
+        assert [c[0] for c in method_calls] == ["execute", "commit", "close"]
 
         # execute 호출 시 전달된 파라미터 확인
-        call_args = mock_session.execute.call_args
-        params = call_args[0][1]  # 두 번째 positional arg (dict)
+        params = method_calls[0].args[1]  # 두 번째 positional arg (dict)
         assert params["email"] == "user@test.com"
         assert params["refresh_token"] == "refresh-token-value"
         assert "token_expire_at" in params
@@ -278,11 +359,10 @@ class TestRefreshToken:
         """DB에서 refresh_token NULL 처리 확인"""
         auth.delete_refresh_token("user@test.com")
 
-        mock_session.execute.assert_called_once()
-        mock_session.commit.assert_called_once()
-        mock_session.close.assert_called_once()
+        # execute → commit → close 순서로 각 1회 호출
+        method_calls = mock_session.method_calls
+        assert [c[0] for c in method_calls] == ["execute", "commit", "close"]
 
         # execute 호출 시 전달된 파라미터 확인
-        call_args = mock_session.execute.call_args
-        params = call_args[0][1]  # 두 번째 positional arg (dict)
+        params = method_calls[0].args[1]  # 두 번째 positional arg (dict)
         assert params["email"] == "user@test.com"
@@ -1,6 +1,9 @@
 import pytest
 from unittest.mock import patch, MagicMock, AsyncMock
 import httpx
+from fastapi import HTTPException
+
+from class_lib.auth_client import AuthClient
 
 
 class TestAuthClientVerifyToken:
@@ -13,13 +16,12 @@ class TestAuthClientVerifyToken:
             mock_config.return_value.btn_auth_url = "http://localhost:8000/api"
             mock_config.return_value.btn_internal_api_key = "test-internal-key"
 
-            from class_lib.auth_client import AuthClient
             mock_logger = MagicMock()
             return AuthClient(mock_logger)
 
     @pytest.fixture
-    def mock_httpx_success(self):
-        """httpx 성공 응답 Mock"""
+    def httpx_mock(self, monkeypatch):
+        """httpx.AsyncClient Mock (기본: 200 성공 응답, 테스트에서 응답/예외 재지정)"""
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = [{"email": "test@test.com", "role": "admin"}]
@@ -29,87 +31,52 @@ class TestAuthClientVerifyToken:
         mock_client.__aenter__ = AsyncMock(return_value=mock_client)
         mock_client.__aexit__ = AsyncMock(return_value=None)
 
+        monkeypatch.setattr(httpx, "AsyncClient", lambda *args, **kwargs: mock_client)
         return mock_client
 
     @pytest.mark.asyncio
-    async def test_verify_token_success(self, auth_client, mock_httpx_success):
-        """토큰 검증 성공"""
-        with patch("httpx.AsyncClient", return_value=mock_httpx_success):
+    @pytest.mark.parametrize("status_code, expected_code", [
+        (200, None),  # 검증 성공
+        (401, 401),   # 잘못된 토큰
+        (500, 503),   # Auth 서버 오류
+    ])
+    async def test_verify_token_status(self, auth_client, httpx_mock, status_code, expected_code):
+        """응답 상태 코드별 결과 (200 → payload, 401 → 401, 500 → 503)"""
+        httpx_mock.get.return_value.status_code = status_code
+
+        if expected_code is None:
             result = await auth_client.verify_token("valid-token")
-
-        assert result[0]["email"] == "test@test.com"
-        assert result[0]["role"] == "admin"
+            assert result[0]["email"] == "test@test.com"
+            assert result[0]["role"] == "admin"
+        else:
+            with pytest.raises(HTTPException) as exc_info:
+                await auth_client.verify_token("token")
+            assert exc_info.value.status_code == expected_code
 
     @pytest.mark.asyncio
-    async def test_verify_token_sends_internal_api_key(self, auth_client, mock_httpx_success):
+    async def test_verify_token_sends_internal_api_key(self, auth_client, httpx_mock):
         """Internal API Key 헤더 전송 확인"""
-        with patch("httpx.AsyncClient", return_value=mock_httpx_success):
-            await auth_client.verify_token("valid-token")
+        await auth_client.verify_token("valid-token")
 
-        call_kwargs = mock_httpx_success.get.call_args.kwargs
+        call_kwargs = httpx_mock.get.call_args.kwargs
         assert "X-Internal-Api-Key" in call_kwargs.get("headers", {})
         assert call_kwargs["headers"]["X-Internal-Api-Key"] == "test-internal-key"
 
     @pytest.mark.asyncio
-    async def test_verify_token_sends_cookie(self, auth_client, mock_httpx_success):
+    async def test_verify_token_sends_cookie(self, auth_client, httpx_mock):
         """토큰을 쿠키로 전송"""
-        with patch("httpx.AsyncClient", return_value=mock_httpx_success):
-            await auth_client.verify_token("my-token")
+        await auth_client.verify_token("my-token")
 
-        call_kwargs = mock_httpx_success.get.call_args.kwargs
+        call_kwargs = httpx_mock.get.call_args.kwargs
         assert call_kwargs["cookies"]["access_token"] == "my-token"
 
     @pytest.mark.asyncio
-    async def test_verify_token_unauthorized(self, auth_client):
-        """401 응답 시 HTTPException 발생"""
-        from fastapi import HTTPException
-
-        mock_response = MagicMock()
-        mock_response.status_code = 401
-
-        mock_client = MagicMock()
-        mock_client.get = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-
-        with patch("httpx.AsyncClient", return_value=mock_client):
-            with pytest.raises(HTTPException) as exc_info:
-                await auth_client.verify_token("invalid-token")
-
-        assert exc_info.value.status_code == 401
-
-    @pytest.mark.asyncio
-    async def test_verify_token_server_error(self, auth_client):
-        """500 응답 시 503 HTTPException 발생"""
-        from fastapi import HTTPException
-
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-
-        mock_client = MagicMock()
-        mock_client.get = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-
-        with patch("httpx.AsyncClient", return_value=mock_client):
-            with pytest.raises(HTTPException) as exc_info:
-                await auth_client.verify_token("token")
-
-        assert exc_info.value.status_code == 503
-
-    @pytest.mark.asyncio
-    async def test_verify_token_connection_error(self, auth_client):
+    async def test_verify_token_connection_error(self, auth_client, httpx_mock):
         """연결 오류 시 503 HTTPException 발생"""
-        from fastapi import HTTPException
-
-        mock_client = MagicMock()
-        mock_client.get = AsyncMock(side_effect=httpx.RequestError("Connection failed"))
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
+        httpx_mock.get.side_effect = httpx.RequestError("Connection failed")
 
-        with patch("httpx.AsyncClient", return_value=mock_client):
-            with pytest.raises(HTTPException) as exc_info:
-                await auth_client.verify_token("token")
+        with pytest.raises(HTTPException) as exc_info:
+            await auth_client.verify_token("token")
 
         assert exc_info.value.status_code == 503
         assert "unavailable" in exc_info.value.detail.lower()
@@ -125,7 +92,6 @@ class TestAuthClientGetCurrentUser:
             mock_config.return_value.btn_auth_url = "http://localhost:8000/api"
             mock_config.return_value.btn_internal_api_key = "test-key"
 
-            from class_lib.auth_client import AuthClient
             mock_logger = MagicMock()
             return AuthClient(mock_logger)
 
@@ -159,8 +125,6 @@ class TestAuthClientGetCurrentUser:
     @pytest.mark.asyncio
     async def test_get_current_user_no_token(self, auth_client):
         """토큰 없을 시 401 HTTPException"""
-        from fastapi import HTTPException
-
         mock_request = MagicMock()
         mock_request.cookies.get.return_value = None
         mock_request.headers.get.return_value = None
@@ -1,197 +1,142 @@
 import pytest
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 from fastapi import HTTPException
 
+import apps.chatbot.app as chatbot_app
+import apps.chatbot.deps as deps
+from apps.chatbot.deps import get_current_payload, get_user_id, require_role, get_chat_service
 
-# ─────────────────────────────────────────────
-# deps 모듈 import (모듈 레벨 인스턴스 patch 필요)
-# ─────────────────────────────────────────────
 
-@pytest.fixture(autouse=True)
-def reset_chat_service():
-    """각 테스트 전 _chat_service 싱글톤 초기화"""
-    import apps.chatbot.deps as deps_module
-    deps_module._chat_service = None
-    yield
-    deps_module._chat_service = None
+def make_request(cookie=None, auth_header=None):
+    """cookies/headers만 가진 최소 Request 스텁"""
+    return SimpleNamespace(
+        cookies={"access_token": cookie} if cookie else {},
+        headers={"Authorization": auth_header} if auth_header else {},
+    )
 
 
 class TestGetCurrentPayload:
     """get_current_payload 단위 테스트"""
 
-    @pytest.mark.asyncio
-    async def test_get_current_payload_from_cookie(self):
+    @staticmethod
+    def _stub_verify(monkeypatch, payload):
+        """auth.verify_token 스텁 (호출된 토큰 기록)"""
+        called = []
+        monkeypatch.setattr(deps.auth, "verify_token", lambda token: called.append(token) or payload)
+        return called
+
+    async def test_get_current_payload_from_cookie(self, monkeypatch):
         """request.cookies에 access_token → auth.verify_token 호출"""
-        mock_request = MagicMock()
-        mock_request.cookies.get.return_value = "cookie-token"
-        mock_request.headers.get.return_value = None
+        mock_request = make_request(cookie="cookie-token")
 
         expected_payload = {"email": "test@test.com", "role": "admin"}
+        called = self._stub_verify(monkeypatch, expected_payload)
 
-        with patch(
-            "apps.chatbot.deps.auth.verify_token",
-            return_value=expected_payload
-        ) as mock_verify:
-            from apps.chatbot.deps import get_current_payload
-            result = await get_current_payload(mock_request)
+        result = await get_current_payload(mock_request)
 
-        mock_verify.assert_called_once_with("cookie-token")
+        assert called == ["cookie-token"]
         assert result == expected_payload
 
-    @pytest.mark.asyncio
-    async def test_get_current_payload_from_bearer(self):
+    async def test_get_current_payload_from_bearer(self, monkeypatch):
         """Authorization: Bearer 헤더 → auth.verify_token 호출"""
-        mock_request = MagicMock()
-        mock_request.cookies.get.return_value = None
-        mock_request.headers.get.return_value = "Bearer header-token"
+        mock_request = make_request(auth_header="Bearer header-token")
 
         expected_payload = {"email": "test@test.com", "role": "user"}
+        called = self._stub_verify(monkeypatch, expected_payload)
 
-        with patch(
-            "apps.chatbot.deps.auth.verify_token",
-            return_value=expected_payload
-        ) as mock_verify:
-            from apps.chatbot.deps import get_current_payload
-            result = await get_current_payload(mock_request)
+        result = await get_current_payload(mock_request)
 
-        mock_verify.assert_called_once_with("header-token")
+        assert called == ["header-token"]
         assert result == expected_payload
 
-    @pytest.mark.asyncio
-    async def test_get_current_payload_cookie_priority(self):
+    async def test_get_current_payload_cookie_priority(self, monkeypatch):
         """쿠키와 헤더 둘 다 있을 때 쿠키 우선"""
-        mock_request = MagicMock()
-        mock_request.cookies.get.return_value = "cookie-token"
-        mock_request.headers.get.return_value = "Bearer header-token"
+        mock_request = make_request(cookie="cookie-token", auth_header="Bearer header-token")
 
         expected_payload = {"email": "cookie@test.com"}
+        called = self._stub_verify(monkeypatch, expected_payload)
 
-        with patch(
-            "apps.chatbot.deps.auth.verify_token",
-            return_value=expected_payload
-        ) as mock_verify:
-            from apps.chatbot.deps import get_current_payload
-            result = await get_current_payload(mock_request)
+        result = await get_current_payload(mock_request)
 
-        mock_verify.assert_called_once_with("cookie-token")
+        assert called == ["cookie-token"]
         assert result["email"] == "cookie@test.com"
 
-    @pytest.mark.asyncio
     async def test_get_current_payload_no_token(self):
         """토큰 없음 → HTTPException 401"""
-        mock_request = MagicMock()
-        mock_request.cookies.get.return_value = None
-        mock_request.headers.get.return_value = None
-
-        from apps.chatbot.deps import get_current_payload
+        mock_request = make_request()
 
-        with pytest.raises(HTTPException) as exc_info:
+        with pytest.raises(HTTPException, match="(?i)token") as exc_info:
             await get_current_payload(mock_request)
 
         assert exc_info.value.status_code == 401
-        assert "token" in exc_info.value.detail.lower()
 
-    @pytest.mark.asyncio
-    async def test_get_current_payload_invalid_token(self):
+    async def test_get_current_payload_invalid_token(self, monkeypatch):
         """auth.verify_token이 예외 발생 시 전파"""
-        mock_request = MagicMock()
-        mock_request.cookies.get.return_value = "bad-token"
-        mock_request.headers.get.return_value = None
-
-        with patch(
-            "apps.chatbot.deps.auth.verify_token",
-            side_effect=HTTPException(
-                status_code=401,
-                detail="Token error: expired"
-            )
-        ):
-            from apps.chatbot.deps import get_current_payload
-
-            with pytest.raises(HTTPException) as exc_info:
-                await get_current_payload(mock_request)
+        mock_request = make_request(cookie="bad-token")
+
+        def _raise(token):
+            raise HTTPException(status_code=401, detail="Token error: expired")
+
+        monkeypatch.setattr(deps.auth, "verify_token", _raise)
+
+        with pytest.raises(HTTPException, match="(?i)token error") as exc_info:
+            await get_current_payload(mock_request)
 
         assert exc_info.value.status_code == 401
-        assert "token error" in exc_info.value.detail.lower()
 
 
 class TestGetUserId:
     """get_user_id 단위 테스트"""
 
-    def test_get_user_id_dict_with_email(self):
-        """{"email": "a@b.com"} → "a@b.com"'''"""
-        from apps.chatbot.deps import get_user_id
-        result = get_user_id({"email": "a@b.com", "user_id": "123"})
-        assert result == "a@b.com"
-
-    def test_get_user_id_dict_with_user_id(self):
-        """{"user_id": "123"} (email 없음) → "123"'''"""
-        from apps.chatbot.deps import get_user_id
-        result = get_user_id({"user_id": "123"})
-        assert result == "123"
-
-    def test_get_user_id_list_payload(self):
-        """[{"email": "a@b.com"}] → "a@b.com"'''"""
-        from apps.chatbot.deps import get_user_id
-        result = get_user_id([{"email": "a@b.com"}])
-        assert result == "a@b.com"
-
-    def test_get_user_id_fallback_anonymous(self):
-        """{} → "anonymous"'''"""
-        from apps.chatbot.deps import get_user_id
-        result = get_user_id({})
-        assert result == "anonymous"
-
-    def test_get_user_id_empty_list(self):
-        """[] → "anonymous"'''"""
-        from apps.chatbot.deps import get_user_id
-        result = get_user_id([])
-        assert result == "anonymous"
+    @pytest.mark.parametrize("payload, expected", [
+        ({"email": "a@b.com", "user_id": "123"}, "a@b.com"),  # email 우선
+        ({"user_id": "123"}, "123"),  # email 없음 → user_id
+        ([{"email": "a@b.com"}], "a@b.com"),  # list payload
+        ({}, "anonymous"),  # 빈 dict
+        ([], "anonymous"),  # 빈 list
+    ])
+    def test_get_user_id(self, payload, expected):
+        """payload 형태별 user_id 추출"""
+        assert get_user_id(payload) == expected
 
 
 class TestRequireRole:
     """require_role 단위 테스트"""
 
-    @pytest.mark.asyncio
     async def test_require_role_allowed(self):
         """role="admin", require_role("admin") → 통과"""
-        from apps.chatbot.deps import require_role
-
         checker = require_role("admin")
         payload = {"email": "admin@test.com", "role": "admin"}
 
         result = await checker(payload=payload)
         assert result == payload
 
-    @pytest.mark.asyncio
     async def test_require_role_denied(self):
         """role="user", require_role("admin") → HTTPException 403"""
-        from apps.chatbot.deps import require_role
-
         checker = require_role("admin")
         payload = {"email": "user@test.com", "role": "user"}
 
-        with pytest.raises(HTTPException) as exc_info:
+        with pytest.raises(HTTPException, match="admin") as exc_info:
             await checker(payload=payload)
 
         assert exc_info.value.status_code == 403
-        assert "admin" in exc_info.value.detail
 
-    @pytest.mark.asyncio
     async def test_require_role_multiple(self):
         """require_role("admin", "staff") → "staff" 허용"""
-        from apps.chatbot.deps import require_role
-
         checker = require_role("admin", "staff")
         payload = {"email": "staff@test.com", "role": "staff"}
 
         result = await checker(payload=payload)
         assert result == payload
 
-    @pytest.mark.asyncio
+    def test_require_role_is_memoized(self):
+        """같은 roles → 같은 checker 인스턴스"""
+        assert require_role("admin") is require_role("admin")
+        assert require_role("admin") is not require_role("admin", "staff")
+
     async def test_require_role_list_payload(self):
         """payload가 list인 경우 [{"role": "admin"}] 처리"""
-        from apps.chatbot.deps import require_role
-
         checker = require_role("admin")
         payload = [{"email": "admin@test.com", "role": "admin"}]
 
@@ -202,26 +147,29 @@ class TestRequireRole:
 class TestGetChatService:
     """get_chat_service 단위 테스트"""
 
-    def test_get_chat_service_returns_instance(self):
-        """ChatService 인스턴스 반환"""
-        with patch("apps.chatbot.deps.ChatService") as mock_cls:
-            mock_instance = MagicMock()
-            mock_cls.return_value = mock_instance
+    async def test_get_chat_service_from_app_state(self):
+        """app.state.chat_service 인스턴스 반환 (호출 간 동일)"""
+        service = MagicMock()
+        request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(chat_service=service)))
+
+        assert await get_chat_service(request) is service
+        assert await get_chat_service(request) is service
 
-            from apps.chatbot.deps import get_chat_service
-            result = get_chat_service()
+    async def test_lifespan_builds_chat_service_once(self, monkeypatch):
+        """lifespan 진입 시 ChatService 1회 생성 → 이후 호출은 동일 인스턴스"""
+        calls = []
+        instance = object()
 
-        assert result is mock_instance
+        def fake_ctor(*args, **kwargs):
+            calls.append(1)
+            return instance
 
-    def test_get_chat_service_singleton(self):
-        """두 번 호출 시 같은 인스턴스"""
-        with patch("apps.chatbot.deps.ChatService") as mock_cls:
-            mock_instance = MagicMock()
-            mock_cls.return_value = mock_instance
+        monkeypatch.setattr(chatbot_app, "ChatService", fake_ctor)
+        app = chatbot_app.create_app()
 
-            from apps.chatbot.deps import get_chat_service
-            first = get_chat_service()
-            second = get_chat_service()
+        async with app.router.lifespan_context(app):
+            request = SimpleNamespace(app=app)
+            assert await get_chat_service(request) is instance
+            assert await get_chat_service(request) is instance
 
-        assert first is second
-        mock_cls.assert_called_once()
+        assert len(calls) == 1
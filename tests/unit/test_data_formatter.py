@@ -2,19 +2,64 @@
 
 import logging
 import pytest
-from unittest.mock import patch, PropertyMock
+from types import MappingProxyType
 
 from class_lib.data_layer.formatter import DataFormatter, FormattedContext
 
 
-@pytest.fixture
+# 포맷터 로그 출력/레코드 생성 생략 (부모 "test" 로거에는 영향 없음)
+_TEST_LOGGER = logging.getLogger("test.data_formatter")
+_TEST_LOGGER.disabled = True
+
+
+# ─────────────────────────────────────────────
+# 테스트 입력 (모듈 공유, 읽기 전용)
+# ─────────────────────────────────────────────
+
+MATCH_SUMMARY_FIXTURE = MappingProxyType({
+    "tournament": "Korea Open 2024",
+    "round": "Final",
+    "date": "2024-01-15",
+    "status": "completed",
+    "player1": {"name": "안세영", "nation": "KOR"},
+    "player2": {"name": "야마구치", "nation": "JPN"},
+    "scores": [
+        {"game": 1, "p1_score": 21, "p2_score": 15},
+        {"game": 2, "p1_score": 21, "p2_score": 18}
+    ]
+})
+
+PLAYER_STATS_FIXTURE = MappingProxyType({
+    "player_name": "안세영",
+    "total_shots": 200,
+    "winning_shots": 80,
+    "errors": 20,
+    "rally_wins": 45,
+    "rally_losses": 28
+})
+
+SHOT_DISTRIBUTION_FIXTURE = MappingProxyType({
+    "shots": [
+        {"type": "smash", "count": 50, "success": 40},
+        {"type": "drop", "count": 30, "success": 20}
+    ]
+})
+
+RALLY_ANALYSIS_FIXTURE = MappingProxyType({
+    "avg_rally_length": 8.5,
+    "max_rally_length": 23,
+    "winning_rally_length": 9.2,
+    "losing_rally_length": 7.1
+})
+
+
+@pytest.fixture(scope="module")
 def formatter():
-    logger = logging.getLogger("test")
-    with patch.object(DataFormatter, '__init__', lambda self, lg: None):
-        f = DataFormatter.__new__(DataFormatter)
-        f.logger = logger
-        f.max_tokens = 2000
-        return f
+    """DataFormatter (Config 없이 생성, build_context는 상태 변경 없음 → 모듈 내 공유)"""
+    f = DataFormatter.__new__(DataFormatter)
+    f.logger = _TEST_LOGGER
+    f.max_tokens = 2000
+    return f
 
 
 class TestBuildContext:
@@ -29,19 +74,7 @@ class TestBuildContext:
 
     def test_match_summary_only(self, formatter):
         """경기 요약만"""
-        data = {
-            "tournament": "Korea Open 2024",
-            "round": "Final",
-            "date": "2024-01-15",
-            "status": "completed",
-            "player1": {"name": "안세영", "nation": "KOR"},
-            "player2": {"name": "야마구치", "nation": "JPN"},
-            "scores": [
-                {"game": 1, "p1_score": 21, "p2_score": 15},
-                {"game": 2, "p1_score": 21, "p2_score": 18}
-            ]
-        }
-        result = formatter.build_context(match_summary=data)
+        result = formatter.build_context(match_summary=MATCH_SUMMARY_FIXTURE)
         assert "Korea Open 2024" in result.text
         assert "안세영" in result.text
         assert "야마구치" in result.text
@@ -51,54 +84,31 @@ class TestBuildContext:
 
     def test_player_stats(self, formatter):
         """선수 통계"""
-        data = {
-            "player_name": "안세영",
-            "total_shots": 200,
-            "winning_shots": 80,
-            "errors": 20,
-            "rally_wins": 45,
-            "rally_losses": 28
-        }
-        result = formatter.build_context(player_stats=data)
+        result = formatter.build_context(player_stats=PLAYER_STATS_FIXTURE)
         assert "안세영" in result.text
         assert "40.0%" in result.text  # 80/200
         assert "player_stats" in result.data_sources
 
     def test_shot_distribution(self, formatter):
         """샷 분포"""
-        data = {
-            "shots": [
-                {"type": "smash", "count": 50, "success": 40},
-                {"type": "drop", "count": 30, "success": 20}
-            ]
-        }
-        result = formatter.build_context(shot_distribution=data)
+        result = formatter.build_context(shot_distribution=SHOT_DISTRIBUTION_FIXTURE)
         assert "smash" in result.text
         assert "80.0%" in result.text  # 40/50
         assert "shot_distribution" in result.data_sources
 
     def test_rally_analysis(self, formatter):
         """랠리 분석"""
-        data = {
-            "avg_rally_length": 8.5,
-            "max_rally_length": 23,
-            "winning_rally_length": 9.2,
-            "losing_rally_length": 7.1
-        }
-        result = formatter.build_context(rally_analysis=data)
+        result = formatter.build_context(rally_analysis=RALLY_ANALYSIS_FIXTURE)
         assert "8.5" in result.text
         assert "23" in result.text
         assert "rally_analysis" in result.data_sources
 
     def test_multiple_sources(self, formatter):
         """복수 데이터 소스"""
-        match = {"tournament": "Test", "round": "F", "date": "2024", "status": "done",
-                 "player1": {"name": "A", "nation": "X"},
-                 "player2": {"name": "B", "nation": "Y"}, "scores": []}
-        rally = {"avg_rally_length": 5, "max_rally_length": 10,
-                 "winning_rally_length": 6, "losing_rally_length": 4}
-
-        result = formatter.build_context(match_summary=match, rally_analysis=rally)
+        result = formatter.build_context(
+            match_summary=MATCH_SUMMARY_FIXTURE,
+            rally_analysis=RALLY_ANALYSIS_FIXTURE
+        )
         assert "match_summary" in result.data_sources
         assert "rally_analysis" in result.data_sources
         assert len(result.data_sources) == 2
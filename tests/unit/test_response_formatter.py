@@ -1,15 +1,74 @@
 """ResponseFormatter 단위 테스트"""
 
+import json
 import logging
 import pytest
 
 from class_lib.response_formatter import ResponseFormatter, ParsedResponse
 
 
-@pytest.fixture
+# 포맷터 로그 출력/레코드 생성 생략 (부모 "test" 로거에는 영향 없음)
+_TEST_LOGGER = logging.getLogger("test.response_formatter")
+_TEST_LOGGER.disabled = True
+
+
+# ─────────────────────────────────────────────
+# 테스트 입력 (모듈 로드 시 1회 생성)
+# ─────────────────────────────────────────────
+
+def _json_block(data: dict) -> str:
+    """dict → ```json 코드블록"""
+    return "```json\n" + json.dumps(data, ensure_ascii=False, indent=2) + "\n```"
+
+
+def _chart(chart_type: str, title: str, labels: list, label: str, data: list) -> dict:
+    return {
+        "type": chart_type,
+        "title": title,
+        "data": {"labels": labels, "datasets": [{"label": label, "data": data}]},
+    }
+
+
+SINGLE_CHART_CONTENT = "분석 결과입니다.\n\n" + _json_block({
+    "charts": [_chart("bar", "샷 유형별 득점률", ["스매시", "드롭"], "득점률", [78, 65])]
+})
+
+MULTI_CHART_CONTENT = "결과:\n\n" + _json_block({
+    "charts": [
+        _chart("bar", "차트1", ["A", "B"], "값", [1, 2]),
+        _chart("pie", "차트2", ["X", "Y"], "비율", [60, 40]),
+    ]
+})
+
+MIXED_JSON_CONTENT = (
+    "API 예시:\n\n" + _json_block({"player_id": 123, "name": "test"})
+    + "\n\n분석 결과:\n\n"
+    + _json_block({"charts": [_chart("line", "추세", ["1월", "2월"], "값", [10, 20])]})
+)
+
+INVALID_CHART_CONTENTS = [
+    pytest.param(
+        _json_block({"charts": [_chart("scatter", "테스트", ["A"], "v", [1])]}),
+        id="invalid-type",
+    ),
+    pytest.param(
+        _json_block({"charts": [{
+            "type": "bar",
+            "data": {"labels": ["A"], "datasets": [{"label": "v", "data": [1]}]},
+        }]}),
+        id="missing-title",
+    ),
+    pytest.param(
+        _json_block({"charts": [_chart("bar", "테스트", ["A", "B", "C"], "v", [1, 2])]}),
+        id="length-mismatch",
+    ),
+]
+
+
+@pytest.fixture(scope="session")
 def formatter():
-    logger = logging.getLogger("test")
-    return ResponseFormatter(logger)
+    """ResponseFormatter (파싱 상태 없음, parse()는 매번 새 ParsedResponse 반환 → 세션 공유)"""
+    return ResponseFormatter(_TEST_LOGGER)
 
 
 class TestParseBasic:
@@ -43,8 +102,7 @@ class TestParseWithChart:
 
     def test_single_chart(self, formatter):
         """차트 1개 포함"""
-        content = '분석 결과입니다.\n\n```json\n{\n  "charts": [\n    {\n      "type": "bar",\n      "title": "샷 유형별 득점률",\n      "data": {\n        "labels": ["스매시", "드롭"],\n        "datasets": [{"label": "득점률", "data": [78, 65]}]\n      }\n    }\n  ]\n}\n```'
-        result = formatter.parse(content)
+        result = formatter.parse(SINGLE_CHART_CONTENT)
         assert result.has_charts is True
         assert len(result.charts) == 1
         assert result.charts[0]["type"] == "bar"
@@ -54,16 +112,14 @@ class TestParseWithChart:
 
     def test_multiple_charts(self, formatter):
         """차트 여러 개"""
-        content = '결과:\n\n```json\n{\n  "charts": [\n    {\n      "type": "bar",\n      "title": "차트1",\n      "data": {"labels": ["A", "B"], "datasets": [{"label": "값", "data": [1, 2]}]}\n    },\n    {\n      "type": "pie",\n      "title": "차트2",\n      "data": {"labels": ["X", "Y"], "datasets": [{"label": "비율", "data": [60, 40]}]}\n    }\n  ]\n}\n```'
-        result = formatter.parse(content)
+        result = formatter.parse(MULTI_CHART_CONTENT)
         assert len(result.charts) == 2
         assert result.charts[0]["type"] == "bar"
         assert result.charts[1]["type"] == "pie"
 
     def test_chart_plus_normal_json(self, formatter):
         """차트 JSON + 일반 JSON 혼재"""
-        content = 'API 예시:\n\n```json\n{"player_id": 123, "name": "test"}\n```\n\n분석 결과:\n\n```json\n{\n  "charts": [\n    {\n      "type": "line",\n      "title": "추세",\n      "data": {"labels": ["1월", "2월"], "datasets": [{"label": "값", "data": [10, 20]}]}\n    }\n  ]\n}\n```'
-        result = formatter.parse(content)
+        result = formatter.parse(MIXED_JSON_CONTENT)
         assert len(result.charts) == 1
         assert result.charts[0]["type"] == "line"
         # 일반 JSON은 텍스트에 유지
@@ -73,25 +129,13 @@ class TestParseWithChart:
 class TestValidation:
     """차트 유효성 검증 테스트"""
 
-    def test_invalid_chart_type(self, formatter):
-        """허용되지 않는 차트 타입"""
-        content = '```json\n{\n  "charts": [\n    {"type": "scatter", "title": "테스트", "data": {"labels": ["A"], "datasets": [{"label": "v", "data": [1]}]}}\n  ]\n}\n```'
+    @pytest.mark.parametrize("content", INVALID_CHART_CONTENTS)
+    def test_invalid_chart_rejected(self, formatter, content):
+        """유효하지 않은 차트 → 제외"""
         result = formatter.parse(content)
         assert result.charts == []
         assert result.has_charts is False
 
-    def test_missing_title(self, formatter):
-        """title 누락"""
-        content = '```json\n{\n  "charts": [\n    {"type": "bar", "data": {"labels": ["A"], "datasets": [{"label": "v", "data": [1]}]}}\n  ]\n}\n```'
-        result = formatter.parse(content)
-        assert result.charts == []
-
-    def test_labels_data_length_mismatch(self, formatter):
-        """labels/data 길이 불일치"""
-        content = '```json\n{\n  "charts": [\n    {"type": "bar", "title": "테스트", "data": {"labels": ["A", "B", "C"], "datasets": [{"label": "v", "data": [1, 2]}]}}\n  ]\n}\n```'
-        result = formatter.parse(content)
-        assert result.charts == []
-
     def test_invalid_json(self, formatter):
         """잘못된 JSON → Graceful Degradation"""
         content = '텍스트\n\n```json\n{invalid json here}\n```'
@@ -0,0 +1,18 @@
+"""ChatSession / ChatMessage 단위 테스트"""
+
+from class_lib.session_client import ChatSession
+
+
+class TestChatSessionSerialization:
+    """to_dict / from_dict 왕복 테스트"""
+
+    def test_round_trip_keeps_timestamps(self):
+        """재로드 시 메시지 timestamp 유지"""
+        session = ChatSession(session_id="s1", user_id="u1", context_type="badminton")
+        session.add_message("user", "안녕하세요")
+        session.add_message("assistant", "반갑습니다")
+
+        loaded = ChatSession.from_dict(session.to_dict())
+
+        assert loaded.to_dict() == session.to_dict()
+        assert [m.timestamp for m in loaded.messages] == [m.timestamp for m in session.messages]
@@ -0,0 +1,60 @@
+"""SkillLoader 단위 테스트"""
+
+import logging
+import os
+import pytest
+
+from class_lib.chat_service import SkillLoader
+
+
+@pytest.fixture
+def skills_dir(tmp_path):
+    (tmp_path / "_base.md").write_text("base", encoding="utf-8")
+    (tmp_path / "badminton.md").write_text("badminton", encoding="utf-8")
+    return tmp_path
+
+
+@pytest.fixture
+def loader(skills_dir):
+    return SkillLoader(logging.getLogger("test"), skills_dir=str(skills_dir))
+
+
+class TestListSkills:
+    """list_skills 인덱스 캐시 테스트"""
+
+    def test_excludes_underscore_files(self, loader):
+        """_로 시작하는 파일 제외"""
+        assert loader.list_skills() == ["badminton"]
+
+    def test_missing_dir(self, tmp_path):
+        """디렉토리 없음 → 빈 목록"""
+        loader = SkillLoader(logging.getLogger("test"), skills_dir=str(tmp_path / "none"))
+        assert loader.list_skills() == []
+
+    def test_cached_until_dir_changes(self, loader, skills_dir):
+        """디렉토리 mtime 변경 시에만 재스캔"""
+        assert loader.list_skills() == ["badminton"]
+        stat = skills_dir.stat()
+
+        (skills_dir / "tennis.md").write_text("tennis", encoding="utf-8")
+        os.utime(skills_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert loader.list_skills() == ["badminton"]
+
+        os.utime(skills_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert sorted(loader.list_skills()) == ["badminton", "tennis"]
+
+    def test_clear_cache_resets_index(self, loader, skills_dir):
+        """clear_cache(None) 호출 시 인덱스 재구성"""
+        loader.list_skills()
+        stat = skills_dir.stat()
+
+        (skills_dir / "tennis.md").write_text("tennis", encoding="utf-8")
+        os.utime(skills_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        loader.clear_cache()
+
+        assert sorted(loader.list_skills()) == ["badminton", "tennis"]
+
+    def test_returns_copy(self, loader):
+        """반환 목록 변경이 캐시에 영향 없음"""
+        loader.list_skills().append("x")
+        assert loader.list_skills() == ["badminton"]